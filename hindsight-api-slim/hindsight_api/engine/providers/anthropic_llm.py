@@ -177,7 +177,10 @@ class AnthropicLLM(LLMInterface):
         }
 
         if system_prompt:
-            call_params["system"] = system_prompt
+            # Mark the system prompt as a cacheable prefix. Callers such as fact
+            # extraction send identical instructions + schema on every call, so
+            # repeats are served from Anthropic's prompt cache instead of re-prefilled.
+            call_params["system"] = [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
 
         if temperature is not None:
             call_params["temperature"] = temperature
@@ -217,7 +220,15 @@ class AnthropicLLM(LLMInterface):
 
                 # Record metrics and log slow calls
                 duration = time.time() - start_time
-                input_tokens = response.usage.input_tokens or 0 if response.usage else 0
+                # With prompt caching, input_tokens only counts the uncached part
+                usage = response.usage
+                input_tokens = (
+                    (usage.input_tokens or 0)
+                    + (getattr(usage, "cache_read_input_tokens", None) or 0)
+                    + (getattr(usage, "cache_creation_input_tokens", None) or 0)
+                    if usage
+                    else 0
+                )
                 output_tokens = response.usage.output_tokens or 0 if response.usage else 0
                 total_tokens = input_tokens + output_tokens
 
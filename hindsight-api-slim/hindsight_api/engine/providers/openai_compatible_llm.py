@@ -28,6 +28,7 @@ from typing import Any
 from urllib.parse import parse_qs, urlparse, urlunparse
 
 import httpx
+import orjson
 from openai import APIConnectionError, APIStatusError, AsyncOpenAI, LengthFinishReasonError
 
 from hindsight_api.config import DEFAULT_LLM_TIMEOUT, ENV_LLM_TIMEOUT
@@ -576,11 +577,11 @@ class OpenAICompatibleLLM(LLMInterface):
                     # Claude via proxies). No-op when content is already bare JSON.
                     clean_content = _strip_code_fences(content)
                     try:
-                        json_data = json.loads(clean_content)
+                        json_data = orjson.loads(clean_content)
                     except json.JSONDecodeError:
                         # Fallback to parsing raw content in case stripping was wrong
                         try:
-                            json_data = json.loads(content)
+                            json_data = orjson.loads(content)
                         except json.JSONDecodeError as json_err:
                             # Truncate content for logging
                             content_preview = content[:500] if content else "<empty>"
@@ -1059,10 +1060,12 @@ class OpenAICompatibleLLM(LLMInterface):
                 if attempt > 0:
                     set_stage(f"llm.ollama_native.{scope}.attempt={attempt + 1}/{max_retries + 1}")
                 try:
-                    response = await client.post(native_url, json=payload)
+                    response = await client.post(
+                        native_url, content=orjson.dumps(payload), headers={"Content-Type": "application/json"}
+                    )
                     response.raise_for_status()
 
-                    result = response.json()
+                    result = orjson.loads(response.content)
                     content = result.get("message", {}).get("content", "")
 
                     # Strip markdown code fences if present (safety net —
@@ -1070,11 +1073,11 @@ class OpenAICompatibleLLM(LLMInterface):
                     # but some models may still wrap in fences)
                     clean_content = _strip_code_fences(content)
                     try:
-                        json_data = json.loads(clean_content)
+                        json_data = orjson.loads(clean_content)
                     except json.JSONDecodeError:
                         # Fallback to raw content
                         try:
-                            json_data = json.loads(content)
+                            json_data = orjson.loads(content)
                         except json.JSONDecodeError as json_err:
                             content_preview = content[:500] if content else "<empty>"
                             if content and len(content) > 700:
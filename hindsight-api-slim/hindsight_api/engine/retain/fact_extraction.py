@@ -113,6 +113,32 @@ def _sanitize_text(text: str | None) -> str | None:
     return sanitize_llm_output(text)
 
 
+# Conversational filler that carries nothing extractable. Kept deliberately short:
+# hedges ("maybe", "kind of") and intensifiers ("really") are meaning-bearing for
+# the epistemic/emotional dimensions and must survive compression.
+_FILLER_RE = re.compile(r"\b(?:u+m+|u+h+|erm|basically|literally|honestly)\b,?[ \t]*", re.IGNORECASE)
+_MULTI_SPACE_RE = re.compile(r"[ \t]{2,}")
+_SPACE_BEFORE_PUNCT_RE = re.compile(r"[ \t]+([,.!?])")
+
+
+def _compress_text(text: str) -> str:
+    """Deterministically strip filler words and redundant spacing. Line breaks are preserved."""
+    text = _FILLER_RE.sub("", text)
+    text = _MULTI_SPACE_RE.sub(" ", text)
+    return _SPACE_BEFORE_PUNCT_RE.sub(r"\1", text)
+
+
+def _maybe_compress(text: str, config) -> str:
+    """
+    Compress text sent to the extraction LLM when retain_compress_input is enabled.
+
+    Verbatim mode is never compressed: its content must reach the model word for word.
+    """
+    if config.retain_compress_input and config.retain_extraction_mode != "verbatim":
+        return _compress_text(text)
+    return text
+
+
 class Entity(BaseModel):
     """An entity extracted from text."""
 
@@ -1029,7 +1055,7 @@ def _build_request_body(llm_config, config, prompt: str, user_message: str, resp
     request_body = {
         "model": llm_config.model,
         "messages": [{"role": "system", "content": prompt}, {"role": "user", "content": user_message}],
-        "temperature": 0.1,
+        "temperature": config.retain_llm_temperature,
     }
 
     # Add max_completion_tokens if configured
@@ -1082,7 +1108,10 @@ async def _extract_facts_from_chunk(
     extract_causal_links = config.retain_extract_causal_links
 
     # Build user message using helper function
-    user_message = _build_user_message(chunk, chunk_index, total_chunks, event_date, context, metadata, agent_name)
+    # Only the LLM input is compressed; the returned chunk text stays verbatim.
+    user_message = _build_user_message(
+        _maybe_compress(chunk, config), chunk_index, total_chunks, event_date, context, metadata, agent_name
+    )
 
     # Retry logic for JSON validation errors
     # Use retain-specific overrides if set, otherwise fall back to global LLM config
@@ -1107,7 +1136,7 @@ async def _extract_facts_from_chunk(
                 messages=[{"role": "system", "content": prompt}, {"role": "user", "content": user_message}],
                 response_format=response_schema,
                 scope="retain_extract_facts",
-                temperature=0.1,
+                temperature=config.retain_llm_temperature,
                 max_completion_tokens=config.retain_max_completion_tokens,
                 max_retries=llm_max_retries,
                 initial_backoff=initial_backoff,
@@ -1705,7 +1734,7 @@ async def extract_facts_from_contents_batch_api(
 
             # Build user message using helper function
             user_message = _build_user_message(
-                chunk,
+                _maybe_compress(chunk, config),
                 chunk_index_in_content,
                 len(chunks),
                 item.event_date,
@@ -175,8 +175,10 @@ class WorkerPoller:
         self._optional_routines = OptionalRoutines(self._backend)
         self._shutdown = asyncio.Event()
         self._current_tasks: set[asyncio.Task] = set()
+        # In-flight bookkeeping is only ever touched from the event loop thread
+        # and never across an await, so plain attribute updates are atomic and
+        # need no lock.
         self._in_flight_count = 0
-        self._in_flight_lock = asyncio.Lock()
         self._last_progress_log = 0.0
         self._tasks_completed_since_log = 0
         # Track active tasks locally: operation_id -> ActiveTaskInfo
@@ -242,9 +244,8 @@ class WorkerPoller:
         When an operation type's in-flight count exceeds its reservation, the
         excess tasks are considered to be using shared pool slots.
         """
-        async with self._in_flight_lock:
-            total_in_flight = self._in_flight_count
-            in_flight_snapshot = dict(self._in_flight_by_type)
+        total_in_flight = self._in_flight_count
+        in_flight_snapshot = dict(self._in_flight_by_type)
 
         # Per-type reserved availability
         reserved_available: dict[str, int] = {}
@@ -277,9 +278,8 @@ class WorkerPoller:
         """
         start_time = asyncio.get_event_loop().time()
         while True:
-            async with self._in_flight_lock:
-                if self._in_flight_count == 0:
-                    return True
+            if self._in_flight_count == 0:
+                return True
 
             elapsed = asyncio.get_event_loop().time() - start_time
             if elapsed >= timeout:
@@ -628,33 +628,31 @@ class WorkerPoller:
         bg_task = asyncio.create_task(self._execute_task_inner(task, holder))
 
         # Track this task as active
-        async with self._in_flight_lock:
-            self._active_tasks[task.operation_id] = ActiveTaskInfo(
-                op_type=operation_type,
-                bank_id=bank_id,
-                schema=task.schema,
-                bg_task=bg_task,
-                started_at=time.monotonic(),
-                stage_holder=holder,
-                task_type=task_type,
-            )
-            self._in_flight_count += 1
-            self._in_flight_by_type[operation_type] = self._in_flight_by_type.get(operation_type, 0) + 1
+        self._active_tasks[task.operation_id] = ActiveTaskInfo(
+            op_type=operation_type,
+            bank_id=bank_id,
+            schema=task.schema,
+            bg_task=bg_task,
+            started_at=time.monotonic(),
+            stage_holder=holder,
+            task_type=task_type,
+        )
+        self._in_flight_count += 1
+        self._in_flight_by_type[operation_type] = self._in_flight_by_type.get(operation_type, 0) + 1
 
         # Add cleanup callback
-        bg_task.add_done_callback(lambda _: asyncio.create_task(self._cleanup_task(task.operation_id, operation_type)))
+        bg_task.add_done_callback(lambda _: self._cleanup_task(task.operation_id, operation_type))
 
-    async def _cleanup_task(self, operation_id: str, operation_type: str):
+    def _cleanup_task(self, operation_id: str, operation_type: str):
         """Remove task from tracking after completion."""
-        async with self._in_flight_lock:
-            if operation_id in self._active_tasks:
-                self._active_tasks.pop(operation_id, None)
-                self._in_flight_count -= 1
-                count = self._in_flight_by_type.get(operation_type, 0)
-                if count > 0:
-                    self._in_flight_by_type[operation_type] = count - 1
-                    if self._in_flight_by_type[operation_type] == 0:
-                        del self._in_flight_by_type[operation_type]
+        if operation_id in self._active_tasks:
+            self._active_tasks.pop(operation_id, None)
+            self._in_flight_count -= 1
+            count = self._in_flight_by_type.get(operation_type, 0)
+            if count > 0:
+                self._in_flight_by_type[operation_type] = count - 1
+                if self._in_flight_by_type[operation_type] == 0:
+                    del self._in_flight_by_type[operation_type]
 
     async def _execute_task_inner(self, task: ClaimedTask, holder: StageHolder | None = None):
         """Inner task execution with retry/fail handling.
@@ -904,9 +902,8 @@ class WorkerPoller:
         # Wait for in-flight tasks to complete
         start_time = asyncio.get_event_loop().time()
         while asyncio.get_event_loop().time() - start_time < timeout:
-            async with self._in_flight_lock:
-                in_flight = self._in_flight_count
-                active_task_objects = [info.bg_task for info in self._active_tasks.values()]
+            in_flight = self._in_flight_count
+            active_task_objects = [info.bg_task for info in self._active_tasks.values()]
 
             if in_flight == 0:
                 logger.info(f"Worker {self._worker_id} graceful shutdown complete")
@@ -923,10 +920,9 @@ class WorkerPoller:
         logger.warning(f"Worker {self._worker_id} shutdown timeout after {timeout}s, cancelling remaining tasks")
 
         # Cancel remaining tasks
-        async with self._in_flight_lock:
-            for operation_id, info in list(self._active_tasks.items()):
-                if not info.bg_task.done():
-                    info.bg_task.cancel()
+        for operation_id, info in list(self._active_tasks.items()):
+            if not info.bg_task.done():
+                info.bg_task.cancel()
 
     async def _log_progress_if_due(self):
         """Log progress stats every PROGRESS_LOG_INTERVAL seconds.
@@ -945,10 +941,9 @@ class WorkerPoller:
 
         try:
             # Get local active tasks
-            async with self._in_flight_lock:
-                in_flight = self._in_flight_count
-                in_flight_by_type = dict(self._in_flight_by_type)
-                active_tasks = dict(self._active_tasks)
+            in_flight = self._in_flight_count
+            in_flight_by_type = dict(self._in_flight_by_type)
+            active_tasks = dict(self._active_tasks)
 
             # Compute per-type reserved availability and shared pool
             tasks_in_reserved = 0
@@ -2,17 +2,30 @@
 Pytest configuration and shared fixtures.
 """
 import asyncio
+import dataclasses
+import hashlib
+import inspect
+import json
+import logging
 import os
 from pathlib import Path
 
 import filelock
+import orjson
 import pytest
 import pytest_asyncio
 from dotenv import load_dotenv
 
 from hindsight_api import LLMConfig, LocalSTEmbeddings, MemoryEngine, RequestContext
+from hindsight_api.config import _get_raw_config
 from hindsight_api.engine.cross_encoder import LocalSTCrossEncoder
 from hindsight_api.engine.query_analyzer import DateparserQueryAnalyzer
+from hindsight_api.engine.response_models import TokenUsage
+from hindsight_api.engine.retain.fact_extraction import (
+    Fact,
+    _build_extraction_prompt_and_schema,
+    extract_facts_from_text,
+)
 from hindsight_api.engine.task_backend import SyncTaskBackend
 from hindsight_api.pg0 import EmbeddedPostgres
 
@@ -20,10 +33,30 @@ from hindsight_api.pg0 import EmbeddedPostgres
 DEFAULT_PG0_INSTANCE_NAME = "hindsight-test"
 DEFAULT_PG0_PORT = int(os.environ.get("HINDSIGHT_TEST_PG_PORT", "5556"))
 
+# On-disk cache for LLM fact-extraction responses (enabled with HINDSIGHT_LLM_CACHE=1)
+LLM_CACHE_DIR = Path(__file__).parent / ".llm_cache"
+
+# Cap on concurrent extraction requests issued by gather_extractions, to stay within provider rate limits
+MAX_CONCURRENT_EXTRACTIONS = 16
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--verbose-facts",
+        action="store_true",
+        default=False,
+        help="Log the facts extracted by fact-extraction tests (logger 'tests.facts')",
+    )
+
 
 # Load environment variables from .env at the start of test session
 def pytest_configure(config):
     """Load environment variables before running tests."""
+    # Fact dumps are noisy and only useful when debugging extraction quality
+    logging.getLogger("tests.facts").setLevel(
+        logging.INFO if config.getoption("--verbose-facts") else logging.WARNING
+    )
+
     # Look for .env in the workspace root (two levels up from tests dir)
     env_file = Path(__file__).parent.parent.parent / ".env"
     if env_file.exists():
@@ -342,6 +375,196 @@ def llm_config():
     return LLMConfig.from_env()
 
 
+@pytest.fixture(scope="session")
+def fast_llm_config(llm_config):
+    """
+    LLM configuration for tolerant tests (e.g. keyword-presence checks).
+
+    Uses the same provider and credentials as ``llm_config`` but swaps in the
+    model from HINDSIGHT_TEST_FAST_LLM_MODEL when set, so such tests can run on
+    a smaller, faster model. Falls back to ``llm_config`` when unset.
+
+    With a local provider (ollama, lmstudio) this can name a quantized build,
+    e.g. a ``q4_K_M`` tag, to speed up decoding. Tests that assert exact
+    wording keep using ``llm_config``.
+    """
+    model = os.getenv("HINDSIGHT_TEST_FAST_LLM_MODEL")
+    if not model:
+        return llm_config
+    # Every constructor argument is kept as a same-named attribute; carry them all
+    # over (service tiers, safety settings, router config, ...) and swap only the model.
+    # A shallow copy would not do: the provider client is built from the model in __init__.
+    params = inspect.signature(LLMConfig.__init__).parameters
+    kwargs = {name: getattr(llm_config, name) for name in params if name != "self"}
+    return LLMConfig(**{**kwargs, "model": model})
+
+
+@pytest.fixture(scope="session")
+def extraction_config():
+    """
+    Global config for fact-extraction tests, with the extraction temperature pinned to 0.
+
+    Deterministic sampling keeps assertions stable across runs and lets providers
+    serve repeated prompts from their prompt cache.
+    """
+    return dataclasses.replace(_get_raw_config(), retain_llm_temperature=0.0)
+
+
+@pytest.fixture(scope="session")
+def locomo_session():
+    """
+    Load the locomo conversation fixture once per session.
+
+    Returns (data, session_1 turns, session_1 rendered as "speaker: text" lines).
+    """
+    data = orjson.loads((Path(__file__).parent / "fixtures" / "locomo_conversation_sample.json").read_bytes())
+    session = data["conversation"]["session_1"]
+    text = "\n".join(f"{turn['speaker']}: {turn['text']}" for turn in session)
+    return data, session, text
+
+
+def _extraction_cache_key(text, event_date, llm_config, agent_name, config, context, metadata) -> str:
+    """
+    SHA-256 of the canonicalized extraction request.
+
+    The built system prompt and response schema are hashed in too, so editing the
+    extraction prompt invalidates on-disk entries without a manual version bump.
+    """
+    prompt, response_schema = _build_extraction_prompt_and_schema(config)
+    prompt_hash = hashlib.sha256(
+        (prompt + json.dumps(response_schema.model_json_schema(), sort_keys=True)).encode()
+    ).hexdigest()
+    payload = {
+        "prompt": prompt_hash,
+        "text": text,
+        "context": context,
+        "event_date": event_date.isoformat() if event_date else None,
+        "provider": llm_config.provider,
+        "model": llm_config.model,
+        "agent": agent_name,
+        "metadata": metadata,
+        "chunk_size": config.retain_chunk_size,
+        "extraction_mode": config.retain_extraction_mode,
+        "compress_input": config.retain_compress_input,
+        "temperature": config.retain_llm_temperature,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+@pytest.fixture(scope="session")
+def cached_extract_facts():
+    """
+    Drop-in replacement for ``extract_facts_from_text`` that memoizes responses.
+
+    Identical (text, context, event_date, model, agent, config) requests within a
+    test session share one LLM call, so several tests asserting on the same
+    extraction only pay for it once. Set HINDSIGHT_LLM_CACHE=1 to additionally
+    persist responses in ``tests/.llm_cache`` and serve them across runs and
+    xdist workers; without it each session still calls the real model.
+    Pass ``refresh=True`` to bypass both caches and store the new response, e.g.
+    when retrying a nondeterministic extraction.
+    """
+    memo: dict[str, tuple[list[Fact], list[tuple[str, int]], TokenUsage]] = {}
+
+    async def _extract(
+        *,
+        text,
+        event_date,
+        llm_config,
+        agent_name,
+        config,
+        context="",
+        metadata=None,
+        refresh=False,
+    ):
+        key = _extraction_cache_key(text, event_date, llm_config, agent_name, config, context, metadata)
+        if key in memo and not refresh:
+            return memo[key]
+
+        if os.getenv("HINDSIGHT_LLM_CACHE") != "1":
+            memo[key] = await extract_facts_from_text(
+                text=text,
+                event_date=event_date,
+                llm_config=llm_config,
+                agent_name=agent_name,
+                config=config,
+                context=context,
+                metadata=metadata,
+            )
+            return memo[key]
+
+        # Hold a per-key file lock across lookup, LLM call and write so xdist workers
+        # asking for the same extraction wait for the first one instead of re-issuing it.
+        LLM_CACHE_DIR.mkdir(exist_ok=True)
+        cache_file = LLM_CACHE_DIR / f"{key}.json"
+        async with filelock.AsyncFileLock(str(LLM_CACHE_DIR / f"{key}.lock")):
+            if cache_file.exists() and not refresh:
+                cached = json.loads(cache_file.read_text())
+                facts = [Fact.model_validate(f) for f in cached["facts"]]
+                chunks = [tuple(c) for c in cached["chunks"]]
+                memo[key] = (facts, chunks, TokenUsage.model_validate(cached["usage"]))
+                return memo[key]
+
+            facts, chunks, usage = await extract_facts_from_text(
+                text=text,
+                event_date=event_date,
+                llm_config=llm_config,
+                agent_name=agent_name,
+                config=config,
+                context=context,
+                metadata=metadata,
+            )
+            # Write-then-rename so a reader never sees a partially written entry
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            tmp_file.write_text(
+                json.dumps(
+                    {
+                        "facts": [f.model_dump(mode="json") for f in facts],
+                        "chunks": chunks,
+                        "usage": usage.model_dump(mode="json"),
+                    }
+                )
+            )
+            tmp_file.replace(cache_file)
+        memo[key] = (facts, chunks, usage)
+        return memo[key]
+
+    return _extract
+
+
+@pytest.fixture(scope="session")
+def gather_extractions(cached_extract_facts):
+    """
+    Return ``gather(cases, llm_config, config)``, which extracts every case concurrently.
+
+    ``cases`` maps a case name to ``cached_extract_facts`` keyword arguments (text,
+    event_date, context, agent_name, optionally its own config). The returned dict
+    maps each name to its facts, or to the exception its extraction raised so that
+    only the tests using that case fail; read it back with :func:`facts_for`.
+    """
+
+    async def gather(cases, llm_config, config):
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_EXTRACTIONS)
+
+        async def _extract(case):
+            async with semaphore:
+                facts, _, _ = await cached_extract_facts(**{"llm_config": llm_config, "config": config, **case})
+                return facts
+
+        results = await asyncio.gather(*(_extract(case) for case in cases.values()), return_exceptions=True)
+        return dict(zip(cases, results))
+
+    return gather
+
+
+def facts_for(extractions, name):
+    """Return the facts gathered for a case, re-raising its extraction error if any."""
+    result = extractions[name]
+    if isinstance(result, BaseException):
+        raise result
+    return result
+
+
 @pytest.fixture(scope="session")
 def embeddings(tmp_path_factory, worker_id):
     """
@@ -410,23 +633,9 @@ def query_analyzer():
 
 
 
-@pytest_asyncio.fixture(scope="function")
-async def memory(pg0_db_url, embeddings, cross_encoder, query_analyzer):
-    """
-    Provide a MemoryEngine instance for each test.
-
-    Must be function-scoped because:
-    1. pytest-xdist runs tests in separate processes with different event loops
-    2. asyncpg pools are bound to the event loop that created them
-    3. Each test needs its own pool in its own event loop
-
-    Uses small pool sizes since tests run in parallel.
-    Uses pg0_db_url (a postgresql:// URL) directly, so MemoryEngine won't try to
-    manage pg0 lifecycle - that's handled by the session-scoped pg0_db_url fixture.
-    Migrations are disabled here since they're run once at session scope in pg0_db_url.
-    Uses SyncTaskBackend so async tasks execute immediately (no worker needed).
-    """
-    mem = MemoryEngine(
+def _make_memory_engine(pg0_db_url, embeddings, cross_encoder, query_analyzer) -> MemoryEngine:
+    """Build the test MemoryEngine shared by the function- and module-scoped fixtures."""
+    return MemoryEngine(
         db_url=pg0_db_url,  # Direct postgresql:// URL, not pg0://
         memory_llm_provider=os.getenv("HINDSIGHT_API_LLM_PROVIDER", "groq"),
         memory_llm_api_key=os.getenv("HINDSIGHT_API_LLM_API_KEY"),
@@ -440,8 +649,9 @@ async def memory(pg0_db_url, embeddings, cross_encoder, query_analyzer):
         run_migrations=False,  # Migrations already run at session scope
         task_backend=SyncTaskBackend(),  # Execute tasks immediately in tests
     )
-    await mem.initialize()
-    yield mem
+
+
+async def _close_memory_engine(mem: MemoryEngine) -> None:
     try:
         if mem._pool and not mem._pool._closing:
             await mem.close()
@@ -449,6 +659,56 @@ async def memory(pg0_db_url, embeddings, cross_encoder, query_analyzer):
         pass
 
 
+@pytest_asyncio.fixture(scope="function")
+async def memory(pg0_db_url, embeddings, cross_encoder, query_analyzer):
+    """
+    Provide a MemoryEngine instance for each test.
+
+    Must be function-scoped because:
+    1. pytest-xdist runs tests in separate processes with different event loops
+    2. asyncpg pools are bound to the event loop that created them
+    3. Each test needs its own pool in its own event loop
+
+    Uses small pool sizes since tests run in parallel.
+    Uses pg0_db_url (a postgresql:// URL) directly, so MemoryEngine won't try to
+    manage pg0 lifecycle - that's handled by the session-scoped pg0_db_url fixture.
+    Migrations are disabled here since they're run once at session scope in pg0_db_url.
+    Uses SyncTaskBackend so async tasks execute immediately (no worker needed).
+    """
+    mem = _make_memory_engine(pg0_db_url, embeddings, cross_encoder, query_analyzer)
+    await mem.initialize()
+    yield mem
+    await _close_memory_engine(mem)
+
+
+@pytest_asyncio.fixture(scope="function")
+async def db_conn(memory):
+    """
+    Provide one connection from the memory engine's pool for direct SQL probes.
+
+    Reusing a single connection keeps asyncpg's per-connection statement cache
+    warm across a test's queries instead of acquiring per probe.
+    """
+    pool = await memory._get_pool()
+    async with pool.acquire() as conn:
+        yield conn
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def module_memory(pg0_db_url, embeddings, cross_encoder, query_analyzer):
+    """
+    Provide one MemoryEngine shared by every test in a module.
+
+    For modules that ingest a corpus once and only read from it afterwards.
+    The pool is bound to the module event loop, so tests using this fixture
+    must run with ``@pytest.mark.asyncio(loop_scope="module")``.
+    """
+    mem = _make_memory_engine(pg0_db_url, embeddings, cross_encoder, query_analyzer)
+    await mem.initialize()
+    yield mem
+    await _close_memory_engine(mem)
+
+
 @pytest_asyncio.fixture(scope="function")
 async def memory_no_llm_verify(pg0_db_url, embeddings, cross_encoder, query_analyzer):
     """
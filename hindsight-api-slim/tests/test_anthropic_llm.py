@@ -0,0 +1,59 @@
+"""
+Unit tests for the Anthropic provider's request shaping (no network).
+"""
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from hindsight_api.engine.providers.anthropic_llm import AnthropicLLM
+
+
+def _make_llm(response) -> AnthropicLLM:
+    llm = AnthropicLLM(provider="anthropic", api_key="test-key", base_url="", model="claude-test")
+    llm._client = SimpleNamespace(messages=SimpleNamespace(create=AsyncMock(return_value=response)))
+    return llm
+
+
+def _response(text: str, **usage) -> SimpleNamespace:
+    return SimpleNamespace(
+        content=[SimpleNamespace(type="text", text=text)],
+        usage=SimpleNamespace(output_tokens=5, **usage),
+        stop_reason="end_turn",
+    )
+
+
+@pytest.mark.asyncio
+async def test_system_prompt_marked_for_prompt_caching():
+    llm = _make_llm(_response("ok", input_tokens=10))
+
+    await llm.call(
+        messages=[{"role": "system", "content": "Static instructions"}, {"role": "user", "content": "hi"}],
+        max_retries=0,
+    )
+
+    system = llm._client.messages.create.call_args.kwargs["system"]
+    assert system == [{"type": "text", "text": "Static instructions", "cache_control": {"type": "ephemeral"}}]
+
+
+@pytest.mark.asyncio
+async def test_cached_prompt_tokens_counted_as_input():
+    llm = _make_llm(_response("ok", input_tokens=10, cache_read_input_tokens=80, cache_creation_input_tokens=20))
+
+    _, usage = await llm.call(
+        messages=[{"role": "system", "content": "Static instructions"}, {"role": "user", "content": "hi"}],
+        max_retries=0,
+        return_usage=True,
+    )
+
+    assert usage.input_tokens == 110
+    assert usage.total_tokens == 115
+
+
+@pytest.mark.asyncio
+async def test_no_system_param_without_system_message():
+    llm = _make_llm(_response("ok", input_tokens=10))
+
+    await llm.call(messages=[{"role": "user", "content": "hi"}], max_retries=0)
+
+    assert "system" not in llm._client.messages.create.call_args.kwargs
@@ -11,7 +11,6 @@ from datetime import datetime
 
 import pytest
 
-from hindsight_api import LLMConfig
 from hindsight_api.config import _get_raw_config
 from hindsight_api.engine.retain.fact_extraction import extract_facts_from_text
 
@@ -20,7 +19,7 @@ class TestCausalRelationsValidation:
     """Tests for causal relations index validation."""
 
     @pytest.mark.asyncio
-    async def test_causal_relations_only_reference_previous_facts(self):
+    async def test_causal_relations_only_reference_previous_facts(self, llm_config):
         """
         Test that causal relations can only reference facts that appear before them.
 
@@ -36,7 +35,6 @@ class TestCausalRelationsValidation:
         """
 
         context = "Personal life update"
-        llm_config = LLMConfig.from_env()
         event_date = datetime(2024, 3, 15)
 
         facts, _, usage = await extract_facts_from_text(
@@ -66,7 +64,7 @@ class TestCausalRelationsValidation:
                     )
 
     @pytest.mark.asyncio
-    async def test_first_fact_has_no_causal_relations(self):
+    async def test_first_fact_has_no_causal_relations(self, llm_config):
         """
         Test that the first fact (index 0) cannot have causal relations.
 
@@ -81,7 +79,6 @@ class TestCausalRelationsValidation:
         """
 
         context = "Project update"
-        llm_config = LLMConfig.from_env()
         event_date = datetime(2024, 6, 1)
 
         facts, _, _ = await extract_facts_from_text(
@@ -107,7 +104,7 @@ class TestCausalRelationsValidation:
                 )
 
     @pytest.mark.asyncio
-    async def test_causal_chain_extraction(self):
+    async def test_causal_chain_extraction(self, llm_config):
         """
         Test that a clear causal chain is extracted with valid relations.
         """
@@ -118,7 +115,6 @@ class TestCausalRelationsValidation:
         """
 
         context = "Personal achievement story"
-        llm_config = LLMConfig.from_env()
         event_date = datetime(2024, 7, 15)
 
         facts, _, _ = await extract_facts_from_text(
@@ -152,7 +148,7 @@ class TestCausalRelationsValidation:
                 )
 
     @pytest.mark.asyncio
-    async def test_token_efficiency_with_causal_relations(self):
+    async def test_token_efficiency_with_causal_relations(self, llm_config):
         """
         Test that causal relations don't cause excessive output tokens.
 
@@ -168,7 +164,6 @@ class TestCausalRelationsValidation:
         """
 
         context = "Business impact analysis"
-        llm_config = LLMConfig.from_env()
         event_date = datetime(2024, 4, 1)
 
         facts, _, usage = await extract_facts_from_text(
@@ -193,7 +188,7 @@ class TestCausalRelationsValidation:
             )
 
     @pytest.mark.asyncio
-    async def test_relation_types_are_backward_looking(self):
+    async def test_relation_types_are_backward_looking(self, llm_config):
         """
         Test that all relation types describe how the current fact
         relates to a previous fact (caused_by, enabled_by, prevented_by).
@@ -205,7 +200,6 @@ class TestCausalRelationsValidation:
         """
 
         context = "Career progression"
-        llm_config = LLMConfig.from_env()
         event_date = datetime(2024, 5, 1)
 
         facts, _, _ = await extract_facts_from_text(
@@ -9,7 +9,6 @@ from datetime import datetime
 
 import pytest
 
-from hindsight_api import LLMConfig
 from hindsight_api.config import _get_raw_config
 from hindsight_api.engine.retain.fact_extraction import extract_facts_from_text
 
@@ -18,7 +17,7 @@ class TestCausalRelationships:
     """Tests for causal relationship extraction and validation."""
 
     @pytest.mark.asyncio
-    async def test_causal_chain_extraction(self):
+    async def test_causal_chain_extraction(self, llm_config):
         """
         Test that a clear causal chain is extracted with valid relationships.
 
@@ -35,7 +34,6 @@ After searching for weeks, I finally found a cheaper apartment in Brooklyn.
 """
 
         context = "Personal story about housing change"
-        llm_config = LLMConfig.from_env()
 
         facts, _, _ = await extract_facts_from_text(
             text=text, event_date=datetime(2024, 3, 15), context=context, llm_config=llm_config, agent_name="TestUser",
@@ -87,7 +85,7 @@ After searching for weeks, I finally found a cheaper apartment in Brooklyn.
             )
 
     @pytest.mark.asyncio
-    async def test_complex_causal_web(self):
+    async def test_complex_causal_web(self, llm_config):
         """
         Test a more complex scenario with multiple interconnected causes.
 
@@ -104,7 +102,6 @@ The renovation took three months and cost $15,000.
 """
 
         context = "Home repair story"
-        llm_config = LLMConfig.from_env()
 
         facts, _, _ = await extract_facts_from_text(
             text=text, event_date=datetime(2024, 6, 1), context=context, llm_config=llm_config, agent_name="TestUser",
@@ -124,7 +121,7 @@ The renovation took three months and cost $15,000.
                     )
 
     @pytest.mark.asyncio
-    async def test_no_self_referencing_causal_relations(self):
+    async def test_no_self_referencing_causal_relations(self, llm_config):
         """
         Test that facts don't have causal relations pointing to themselves.
         """
@@ -135,7 +132,6 @@ Machine learning fascinated me so much that I changed my career to data science.
 """
 
         context = "Career change story"
-        llm_config = LLMConfig.from_env()
 
         facts, _, _ = await extract_facts_from_text(
             text=text, event_date=datetime(2024, 1, 1), context=context, llm_config=llm_config, agent_name="TestUser",
@@ -151,7 +147,7 @@ Machine learning fascinated me so much that I changed my career to data science.
                     )
 
     @pytest.mark.asyncio
-    async def test_bidirectional_causal_relationships(self):
+    async def test_bidirectional_causal_relationships(self, llm_config):
         """
         Test that bidirectional causal relationships (causes and caused_by)
         are handled correctly.
@@ -163,7 +159,6 @@ The new role enabled me to lead a team of engineers.
 """
 
         context = "Work promotion story"
-        llm_config = LLMConfig.from_env()
 
         facts, _, _ = await extract_facts_from_text(
             text=text, event_date=datetime(2024, 2, 15), context=context, llm_config=llm_config, agent_name="TestUser",
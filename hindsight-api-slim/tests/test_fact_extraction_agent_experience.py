@@ -7,7 +7,6 @@ from datetime import datetime
 
 import pytest
 
-from hindsight_api import LLMConfig
 from hindsight_api.config import _get_raw_config
 from hindsight_api.engine.retain.fact_extraction import extract_facts_from_text
 
@@ -16,14 +15,13 @@ class TestAgentExperienceClassification:
     """Tests that first-person coding agent experiences get classified as 'experience'."""
 
     @pytest.mark.asyncio
-    async def test_code_changes_classified_as_experience(self):
+    async def test_code_changes_classified_as_experience(self, llm_config):
         """First-person code change descriptions should be experience, not world."""
         text = """
 I changed the return type of the `process_request` function from `dict` to `ResponseModel`.
 After that, I updated the three callers in `api/handlers.py` to destructure the new model fields.
 The type checker was happy after the change but I noticed one test was still using the old dict keys.
 """
-        llm_config = LLMConfig.from_env()
         facts, _, _ = await extract_facts_from_text(
             text=text,
             event_date=datetime(2025, 3, 28),
@@ -43,14 +41,13 @@ The type checker was happy after the change but I noticed one test was still usi
         )
 
     @pytest.mark.asyncio
-    async def test_debugging_session_classified_as_experience(self):
+    async def test_debugging_session_classified_as_experience(self, llm_config):
         """First-person debugging narrative should be experience, not world."""
         text = """
 The tests were failing with a ConnectionRefusedError on the Redis integration suite.
 I traced it to the connection pool not being initialized before the first test ran.
 I added a setup fixture that ensures the pool is warmed up, and all 47 tests pass now.
 """
-        llm_config = LLMConfig.from_env()
         facts, _, _ = await extract_facts_from_text(
             text=text,
             event_date=datetime(2025, 3, 28),
@@ -70,7 +67,7 @@ I added a setup fixture that ensures the pool is warmed up, and all 47 tests pas
         )
 
     @pytest.mark.asyncio
-    async def test_user_interaction_classified_as_experience(self):
+    async def test_user_interaction_classified_as_experience(self, llm_config):
         """Agent describing interactions with the user should be experience."""
         text = """
 The user asked me to refactor the authentication middleware to support JWT tokens.
@@ -78,7 +75,6 @@ I proposed splitting it into two modules: token_validation.py and session_manage
 The user approved my approach and I started with the token validation logic.
 I discovered that the existing tests were mocking the wrong interface, so I had to rewrite them first.
 """
-        llm_config = LLMConfig.from_env()
         facts, _, _ = await extract_facts_from_text(
             text=text,
             event_date=datetime(2025, 3, 28),
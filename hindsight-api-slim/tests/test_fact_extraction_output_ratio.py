@@ -5,76 +5,34 @@ Ensures that fact extraction doesn't produce excessively verbose output
 relative to input size.
 """
 
-import json
+import dataclasses
+import logging
+import re
 from datetime import datetime
+from typing import NamedTuple
 
 import pytest
+import pytest_asyncio
 
-from hindsight_api import LLMConfig
-from hindsight_api.config import _get_raw_config
-from hindsight_api.engine.retain.fact_extraction import extract_facts_from_text
+from tests.conftest import facts_for
 
+# All extractions for this module are issued from one fixture, so keep the
+# module on a single xdist worker instead of repeating them per worker.
+pytestmark = pytest.mark.xdist_group("fact_extraction_output_ratio")
 
-def estimate_tokens(text: str) -> int:
-    """Rough token estimate: ~4 chars per token for English text."""
-    return len(text) // 4
-
+# Extracted-fact dumps; silenced unless pytest runs with --verbose-facts (see conftest)
+logger = logging.getLogger("tests.facts")
 
-class TestFactExtractionOutputRatio:
-    """Tests for output size relative to input."""
+# A sentence: a run of non-terminator characters closed by ., ! or ?
+_SENT_RE = re.compile(r"[^.!?\n]+[.!?]")
 
-    @pytest.mark.asyncio
-    async def test_output_ratio_simple_text(self):
-        """
-        Test that output size is reasonable for simple text.
-
-        The total output (all fact texts combined) should not be excessively
-        larger than the input text.
-        """
-        text = """
+SIMPLE_TEXT = """
 I went to the grocery store yesterday and bought some apples and oranges.
 The weather was really nice, sunny with a light breeze.
 I ran into my neighbor Sarah who mentioned she's planning a trip to Italy next month.
 """
 
-        context = "Personal diary entry"
-        llm_config = LLMConfig.from_env()
-
-        facts, _, _ = await extract_facts_from_text(
-            text=text,
-            event_date=datetime(2024, 6, 15),
-            context=context,
-            llm_config=llm_config,
-            agent_name="TestUser",
-            config=_get_raw_config(),
-        )
-
-        input_length = len(text)
-        output_length = sum(len(f.fact) for f in facts)
-        ratio = output_length / input_length if input_length > 0 else 0
-
-        print(f"\nSimple text test:")
-        print(f"  Input length: {input_length} chars")
-        print(f"  Output length: {output_length} chars")
-        print(f"  Number of facts: {len(facts)}")
-        print(f"  Output/Input ratio: {ratio:.2f}")
-        print(f"  Facts:")
-        for i, f in enumerate(facts):
-            print(f"    [{i}] ({len(f.fact)} chars): {f.fact[:100]}...")
-
-        # Output should not be more than 5x the input
-        assert ratio < 5.0, (
-            f"Output/input ratio {ratio:.2f} is too high! "
-            f"Input: {input_length} chars, Output: {output_length} chars. "
-            f"Facts: {[f.fact for f in facts]}"
-        )
-
-    @pytest.mark.asyncio
-    async def test_output_ratio_conversation(self):
-        """
-        Test output ratio for a typical conversation.
-        """
-        text = """
+CONVERSATION_TEXT = """
 User: Hey, I'm looking for a good restaurant for my anniversary dinner.
 Assistant: I'd recommend La Maison for a romantic atmosphere. They have excellent French cuisine.
 User: That sounds great! We love French food. What's the price range?
@@ -82,43 +40,7 @@ Assistant: It's upscale, around $100-150 per person. They also have a great wine
 User: Perfect, I'll make a reservation for Saturday at 7pm.
 """
 
-        context = "Restaurant recommendation conversation"
-        llm_config = LLMConfig.from_env()
-
-        facts, _, _ = await extract_facts_from_text(
-            text=text,
-            event_date=datetime(2024, 6, 15),
-            context=context,
-            llm_config=llm_config,
-            agent_name="TestUser",
-            config=_get_raw_config(),
-        )
-
-        input_length = len(text)
-        output_length = sum(len(f.fact) for f in facts)
-        ratio = output_length / input_length if input_length > 0 else 0
-
-        print(f"\nConversation test:")
-        print(f"  Input length: {input_length} chars")
-        print(f"  Output length: {output_length} chars")
-        print(f"  Number of facts: {len(facts)}")
-        print(f"  Output/Input ratio: {ratio:.2f}")
-        print(f"  Facts:")
-        for i, f in enumerate(facts):
-            print(f"    [{i}] ({len(f.fact)} chars): {f.fact[:100]}...")
-
-        # Output should not be more than 5x the input
-        assert ratio < 5.0, (
-            f"Output/input ratio {ratio:.2f} is too high! "
-            f"Input: {input_length} chars, Output: {output_length} chars"
-        )
-
-    @pytest.mark.asyncio
-    async def test_output_ratio_longer_text(self):
-        """
-        Test output ratio for a longer piece of text.
-        """
-        text = """
+LONGER_TEXT = """
 Last weekend was incredible. On Saturday morning, I woke up early and went for a 5-mile run
 through the park near my house. The cherry blossoms were in full bloom, which made the whole
 experience magical. After the run, I met up with my college friend Mike at our favorite cafe
@@ -139,31 +61,174 @@ learning to use Lightroom to edit my photos, and I finally feel like I'm getting
 I edited about 20 photos from my recent trip to the mountains.
 """
 
-        context = "Personal blog post"
-        llm_config = LLMConfig.from_env()
+PERSONAL_INFO_TEXT = """
+I love coffee in the morning.
+My favorite restaurant is Olive Garden.
+I work as a software engineer at Google.
+My dog's name is Max.
+I'm planning to visit Japan next year.
+"""
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate: ~4 chars per token for English text."""
+    return len(text) // 4
+
 
-        facts, _, _ = await extract_facts_from_text(
-            text=text,
-            event_date=datetime(2024, 4, 15),
-            context=context,
-            llm_config=llm_config,
+def _log_facts(title: str, stats: dict[str, str], facts, limit: int | None = None, preview: int = 100) -> None:
+    """Log a summary of extracted facts, skipping all formatting when the logger is disabled."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    lines = [f"{title}:", *(f"  {key}: {value}" for key, value in stats.items()), "  Facts:"]
+    shown = facts if limit is None else facts[:limit]
+    lines.extend(f"    [{i}] ({len(f.fact)} chars): {f.fact[:preview]}..." for i, f in enumerate(shown))
+    if limit is not None and len(facts) > limit:
+        lines.append(f"    ... and {len(facts) - limit} more")
+    logger.info("\n".join(lines))
+
+
+class RatioStats(NamedTuple):
+    """Size statistics of extracted facts relative to the input text."""
+
+    input_length: int
+    output_length: int
+    max_fact_length: int
+    ratio: float
+
+
+def _ratio_stats(text: str, facts) -> RatioStats:
+    """Compute total/max fact length and output/input ratio from one list of fact lengths."""
+    input_length = len(text)
+    lengths = [len(f.fact) for f in facts]
+    output_length = sum(lengths)
+    max_fact_length = max(lengths, default=0)
+    ratio = output_length / input_length if input_length > 0 else 0
+    return RatioStats(input_length, output_length, max_fact_length, ratio)
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def extractions(gather_extractions, llm_config, extraction_config, locomo_session):
+    """
+    Run every extraction used by this module concurrently and return facts by case name.
+
+    Each test only asserts on the facts, so issuing all LLM calls up front via
+    gather_extractions makes the module cost about one round-trip instead of one per test.
+    """
+    data, _, locomo_text = locomo_session
+    cases = {
+        "simple_text": dict(
+            text=SIMPLE_TEXT, context="Personal diary entry", event_date=datetime(2024, 6, 15), agent_name="TestUser"
+        ),
+        "conversation": dict(
+            text=CONVERSATION_TEXT,
+            context="Restaurant recommendation conversation",
+            event_date=datetime(2024, 6, 15),
             agent_name="TestUser",
-            config=_get_raw_config(),
+        ),
+        "longer_text": dict(
+            text=LONGER_TEXT, context="Personal blog post", event_date=datetime(2024, 4, 15), agent_name="TestUser"
+        ),
+        "locomo": dict(
+            text=locomo_text,
+            context=f"Conversation between {data['conversation']['speaker_a']} and {data['conversation']['speaker_b']}",
+            event_date=datetime(2023, 5, 8),  # Date from locomo dataset
+            agent_name=data["conversation"]["speaker_a"],
+        ),
+        "personal_info": dict(
+            text=PERSONAL_INFO_TEXT, context="Personal info", event_date=datetime(2024, 6, 15), agent_name="TestUser"
+        ),
+    }
+    # Same input with retain_compress_input enabled, to check the filler-stripping path
+    cases["longer_text_compressed"] = {
+        **cases["longer_text"],
+        "config": dataclasses.replace(extraction_config, retain_compress_input=True),
+    }
+    return await gather_extractions(cases, llm_config, extraction_config)
+
+
+class TestFactExtractionOutputRatio:
+    """Tests for output size relative to input."""
+
+    def test_output_ratio_simple_text(self, extractions):
+        """
+        Test that output size is reasonable for simple text.
+
+        The total output (all fact texts combined) should not be excessively
+        larger than the input text.
+        """
+        text = SIMPLE_TEXT
+        facts = facts_for(extractions, "simple_text")
+
+        input_length, output_length, _, ratio = _ratio_stats(text, facts)
+
+        _log_facts(
+            "Simple text test",
+            {
+                "Input length": f"{input_length} chars",
+                "Output length": f"{output_length} chars",
+                "Number of facts": str(len(facts)),
+                "Output/Input ratio": f"{ratio:.2f}",
+            },
+            facts,
         )
 
-        input_length = len(text)
-        output_length = sum(len(f.fact) for f in facts)
-        ratio = output_length / input_length if input_length > 0 else 0
+        # Output should not be more than 5x the input
+        assert ratio < 5.0, (
+            f"Output/input ratio {ratio:.2f} is too high! "
+            f"Input: {input_length} chars, Output: {output_length} chars. "
+            f"Facts: {[f.fact for f in facts]}"
+        )
 
-        print(f"\nLonger text test:")
-        print(f"  Input length: {input_length} chars")
-        print(f"  Output length: {output_length} chars")
-        print(f"  Number of facts: {len(facts)}")
-        print(f"  Output/Input ratio: {ratio:.2f}")
-        print(f"  Avg fact length: {output_length / len(facts):.0f} chars" if facts else "N/A")
-        print(f"  Facts:")
-        for i, f in enumerate(facts):
-            print(f"    [{i}] ({len(f.fact)} chars): {f.fact[:100]}...")
+    def test_output_ratio_conversation(self, extractions):
+        """
+        Test output ratio for a typical conversation.
+        """
+        text = CONVERSATION_TEXT
+        facts = facts_for(extractions, "conversation")
+
+        input_length, output_length, _, ratio = _ratio_stats(text, facts)
+
+        _log_facts(
+            "Conversation test",
+            {
+                "Input length": f"{input_length} chars",
+                "Output length": f"{output_length} chars",
+                "Number of facts": str(len(facts)),
+                "Output/Input ratio": f"{ratio:.2f}",
+            },
+            facts,
+        )
+
+        # Output should not be more than 5x the input
+        assert ratio < 5.0, (
+            f"Output/input ratio {ratio:.2f} is too high! "
+            f"Input: {input_length} chars, Output: {output_length} chars"
+        )
+
+    @pytest.mark.parametrize("case", ["longer_text", "longer_text_compressed"])
+    def test_output_ratio_longer_text(self, extractions, case):
+        """
+        Test output ratio for a longer piece of text.
+
+        Also run with retain_compress_input enabled: stripping filler must not
+        inflate the output relative to the original input.
+        """
+        text = LONGER_TEXT
+        facts = facts_for(extractions, case)
+
+        input_length, output_length, max_fact_length, ratio = _ratio_stats(text, facts)
+
+        _log_facts(
+            f"Longer text test ({case})",
+            {
+                "Input length": f"{input_length} chars",
+                "Output length": f"{output_length} chars",
+                "Number of facts": str(len(facts)),
+                "Output/Input ratio": f"{ratio:.2f}",
+                "Avg fact length": f"{output_length / len(facts):.0f} chars" if facts else "N/A",
+            },
+            facts,
+        )
 
         # Output should not be more than 4x the input for longer texts
         # (ratio should decrease as input grows)
@@ -173,64 +238,37 @@ I edited about 20 photos from my recent trip to the mountains.
         )
 
         # Also check that individual facts aren't excessively long
-        max_fact_length = max(len(f.fact) for f in facts) if facts else 0
         assert max_fact_length < 1000, (
             f"Individual fact too long: {max_fact_length} chars. "
             f"Facts should be concise."
         )
 
-    @pytest.mark.asyncio
-    async def test_token_ratio_with_locomo_conversation(self):
+    def test_token_ratio_with_locomo_conversation(self, extractions, locomo_session):
         """
         Test output ratio with a realistic locomo conversation.
 
         The user reported: input_tokens=4714, output_tokens=24824, ratio=5.27
         This test uses real conversation data to check for excessive output.
         """
-        import os
-
-        # Load locomo conversation
-        fixture_path = os.path.join(
-            os.path.dirname(__file__),
-            "fixtures",
-            "locomo_conversation_sample.json"
-        )
-        with open(fixture_path, "r") as f:
-            data = json.load(f)
-
-        # Use session_1 (a realistic conversation between Caroline and Melanie)
-        session = data["conversation"]["session_1"]
-
-        # Convert to text format
-        text = "\n".join([f"{turn['speaker']}: {turn['text']}" for turn in session])
-
-        context = f"Conversation between {data['conversation']['speaker_a']} and {data['conversation']['speaker_b']}"
-        llm_config = LLMConfig.from_env()
-
-        facts, _, _ = await extract_facts_from_text(
-            text=text,
-            event_date=datetime(2023, 5, 8),  # Date from locomo dataset
-            context=context,
-            llm_config=llm_config,
-            agent_name=data["conversation"]["speaker_a"],
-            config=_get_raw_config(),
-        )
+        # session_1 is a realistic conversation between Caroline and Melanie
+        _, session, text = locomo_session
+        facts = facts_for(extractions, "locomo")
 
         # Calculate ratios
-        input_length = len(text)
-        output_length = sum(len(f.fact) for f in facts)
-        text_to_output_ratio = output_length / input_length if input_length > 0 else 0
-
-        print(f"\nLocomo conversation test:")
-        print(f"  Input text: {input_length} chars (~{input_length // 4} tokens)")
-        print(f"  Output text: {output_length} chars (~{output_length // 4} tokens)")
-        print(f"  Number of facts: {len(facts)}")
-        print(f"  Output/Input text ratio: {text_to_output_ratio:.2f}")
-        print(f"  Sample facts:")
-        for i, f in enumerate(facts[:5]):  # Show first 5
-            print(f"    [{i}] ({len(f.fact)} chars): {f.fact[:80]}...")
-        if len(facts) > 5:
-            print(f"    ... and {len(facts) - 5} more")
+        input_length, output_length, _, text_to_output_ratio = _ratio_stats(text, facts)
+
+        _log_facts(
+            "Locomo conversation test",
+            {
+                "Input text": f"{input_length} chars (~{estimate_tokens(text)} tokens)",
+                "Output text": f"{output_length} chars (~{output_length // 4} tokens)",
+                "Number of facts": str(len(facts)),
+                "Output/Input text ratio": f"{text_to_output_ratio:.2f}",
+            },
+            facts,
+            limit=5,
+            preview=80,
+        )
 
         # The output should not be more than 4x the input TEXT
         # This catches the extreme 5.27x case reported by the user
@@ -250,44 +288,26 @@ I edited about 20 photos from my recent trip to the mountains.
             f"Expected at most {max_expected_facts}."
         )
 
-    @pytest.mark.asyncio
-    async def test_number_of_facts_reasonable(self):
+    def test_number_of_facts_reasonable(self, extractions):
         """
         Test that the number of extracted facts is reasonable.
 
         We shouldn't extract way more facts than there are sentences/statements
         in the input.
         """
-        text = """
-I love coffee in the morning.
-My favorite restaurant is Olive Garden.
-I work as a software engineer at Google.
-My dog's name is Max.
-I'm planning to visit Japan next year.
-"""
+        text = PERSONAL_INFO_TEXT
+        facts = facts_for(extractions, "personal_info")
 
-        context = "Personal info"
-        llm_config = LLMConfig.from_env()
+        # Count approximate number of statements (sentences)
+        num_statements = sum(1 for _ in _SENT_RE.finditer(text))
 
-        facts, _, _ = await extract_facts_from_text(
-            text=text,
-            event_date=datetime(2024, 6, 15),
-            context=context,
-            llm_config=llm_config,
-            agent_name="TestUser",
-            config=_get_raw_config(),
+        _log_facts(
+            "Number of facts test",
+            {"Input statements": f"~{num_statements}", "Extracted facts": str(len(facts))},
+            facts,
+            preview=80,
         )
 
-        # Count approximate number of statements (sentences)
-        num_statements = len([s for s in text.split('.') if s.strip()])
-
-        print(f"\nNumber of facts test:")
-        print(f"  Input statements: ~{num_statements}")
-        print(f"  Extracted facts: {len(facts)}")
-        print(f"  Facts:")
-        for i, f in enumerate(facts):
-            print(f"    [{i}]: {f.fact[:80]}...")
-
         # Should not extract more than 2x the number of input statements
         assert len(facts) <= num_statements * 2, (
             f"Too many facts extracted: {len(facts)} for ~{num_statements} input statements"
@@ -12,302 +12,207 @@ This comprehensive test suite validates that the fact extraction system:
 These are quality/accuracy tests that verify the LLM-based extraction
 produces semantically correct and complete facts.
 """
+import functools
+import re
 from datetime import UTC, datetime
 
 import pytest
+import pytest_asyncio
+
+from tests.conftest import facts_for
+
+# Reference dates shared by several extraction inputs below
+NOV_13_2024 = datetime(2024, 11, 13)
+MAR_20_2024_UTC = datetime(2024, 3, 20, 14, 0, 0, tzinfo=UTC)
 
-from hindsight_api import LLMConfig
-from hindsight_api.config import _get_raw_config
-from hindsight_api.engine.retain.fact_extraction import extract_facts_from_text
 
 # =============================================================================
 # DIMENSION PRESERVATION TESTS
 # =============================================================================
 
-class TestDimensionPreservation:
-    """Tests that fact extraction preserves all information dimensions."""
-
-    @pytest.mark.asyncio
-    async def test_emotional_dimension_preservation(self):
-        """
-        Test that emotional states and feelings are preserved, not stripped away.
+# Single-dimension inputs keyed by dimension: (text, context, indicators, min_found).
+# At least ``min_found`` indicators must survive extraction for the dimension to
+# count as preserved. All cases share the same event date and agent, and are
+# extracted together by the ``dimension_extractions`` fixture.
+DIMENSION_EVENT_DATE = NOV_13_2024
 
-        Example: "I was thrilled to receive positive feedback"
-        Should NOT become: "I received positive feedback"
+DIMENSION_CASES = {
+    "emotional": (
         """
-        text = """
 I was absolutely thrilled when I received such positive feedback on my presentation!
 Sarah seemed disappointed when she heard the news about the delay.
 Marcus felt anxious about the upcoming interview.
-"""
-
-        context = "Personal journal entry"
-        llm_config = LLMConfig.from_env()
-
-        facts, _, _ = await extract_facts_from_text(
-            text=text,
-            event_date=datetime(2024, 11, 13),
-            context=context,
-            llm_config=llm_config,
-            agent_name="TestUser",
-            config=_get_raw_config(),
-        )
-
-        assert len(facts) > 0, "Should extract at least one fact"
-
-        all_facts_text = " ".join([f.fact.lower() for f in facts])
-
-        emotional_indicators = ["thrilled", "disappointed", "anxious", "positive feedback"]
-        found_emotions = [word for word in emotional_indicators if word in all_facts_text]
-
-        assert len(found_emotions) >= 2, (
-            f"Should preserve emotional dimension. "
-            f"Found: {found_emotions}, Expected at least 2 from: {emotional_indicators}"
-        )
-
-    @pytest.mark.asyncio
-    async def test_sensory_dimension_preservation(self):
-        """Test that sensory details (visual, auditory, etc.) are preserved."""
-        text = """
+""",
+        "Personal journal entry",
+        ["thrilled", "disappointed", "anxious", "positive feedback"],
+        2,
+    ),
+    "sensory": (
+        """
 The coffee tasted bitter and burnt.
 She showed me her bright orange hair, which looked stunning under the lights.
 The music was so loud I could barely hear myself think.
-"""
-
-        context = "Personal experience"
-        llm_config = LLMConfig.from_env()
-
-        facts, _, _ = await extract_facts_from_text(
-            text=text,
-            event_date=datetime(2024, 11, 13),
-            context=context,
-            llm_config=llm_config,
-            agent_name="TestUser",
-            config=_get_raw_config(),
-        )
-
-        assert len(facts) > 0, "Should extract at least one fact"
-
-        all_facts_text = " ".join([f.fact.lower() for f in facts])
-
-        sensory_indicators = ["bitter", "burnt", "bright orange", "loud", "stunning"]
-        found_sensory = [word for word in sensory_indicators if word in all_facts_text]
-
-        assert len(found_sensory) >= 2, (
-            f"Should preserve sensory details. "
-            f"Found: {found_sensory}, Expected at least 2 from: {sensory_indicators}"
-        )
-
-    @pytest.mark.asyncio
-    async def test_cognitive_epistemic_dimension(self):
-        """Test that cognitive states and certainty levels are preserved."""
-        text = """
+""",
+        "Personal experience",
+        ["bitter", "burnt", "bright orange", "loud", "stunning"],
+        2,
+    ),
+    "cognitive": (
+        """
 I realized that the approach wasn't working.
 She wasn't sure if the meeting would happen.
 He's convinced that AI will transform healthcare.
 Maybe we should reconsider the timeline.
-"""
-
-        context = "Team discussion"
-        llm_config = LLMConfig.from_env()
-
-        facts, _, _ = await extract_facts_from_text(
-            text=text,
-            event_date=datetime(2024, 11, 13),
-            context=context,
-            llm_config=llm_config,
-            agent_name="TestUser",
-            config=_get_raw_config(),
-        )
-
-        assert len(facts) > 0, "Should extract at least one fact"
-
-        all_facts_text = " ".join([f.fact.lower() for f in facts])
-
-        cognitive_indicators = ["realized", "wasn't sure", "convinced", "maybe", "reconsider"]
-        found_cognitive = [word for word in cognitive_indicators if word in all_facts_text]
-
-        assert len(found_cognitive) >= 2, (
-            f"Should preserve cognitive/epistemic dimension. "
-            f"Found: {found_cognitive}"
-        )
-
-    @pytest.mark.asyncio
-    async def test_capability_skill_dimension(self):
-        """Test that capabilities, skills, and limitations are preserved."""
-        text = """
+""",
+        "Team discussion",
+        ["realized", "wasn't sure", "convinced", "maybe", "reconsider"],
+        2,
+    ),
+    "capability": (
+        """
 I can speak French fluently.
 Sarah struggles with public speaking.
 He's an expert in machine learning.
 I'm unable to attend the conference due to scheduling conflicts.
-"""
-
-        context = "Personal profile discussion"
-        llm_config = LLMConfig.from_env()
-
-        facts, _, _ = await extract_facts_from_text(
-            text=text,
-            event_date=datetime(2024, 11, 13),
-            context=context,
-            llm_config=llm_config,
-            agent_name="TestUser",
-            config=_get_raw_config(),
-        )
-
-        assert len(facts) > 0, "Should extract at least one fact"
-
-        all_facts_text = " ".join([f.fact.lower() for f in facts])
-
-        capability_indicators = ["can speak", "fluently", "struggles with", "expert in", "unable to"]
-        found_capability = [word for word in capability_indicators if word in all_facts_text]
-
-        assert len(found_capability) >= 2, (
-            f"Should preserve capability/skill dimension. "
-            f"Found: {found_capability}"
-        )
-
-    @pytest.mark.asyncio
-    async def test_comparative_dimension(self):
-        """Test that comparisons and contrasts are preserved."""
-        text = """
+""",
+        "Personal profile discussion",
+        ["can speak", "fluently", "struggles with", "expert in", "unable to"],
+        2,
+    ),
+    "comparative": (
+        """
 This approach is much better than the previous one.
 The new design is worse than expected.
 Unlike last year, we're ahead of schedule.
-"""
-
-        context = "Project review"
-        llm_config = LLMConfig.from_env()
-
-        facts, _, _ = await extract_facts_from_text(
-            text=text,
-            event_date=datetime(2024, 11, 13),
-            context=context,
-            llm_config=llm_config,
-            agent_name="TestUser",
-            config=_get_raw_config(),
-        )
-
-        assert len(facts) > 0, "Should extract at least one fact"
-
-        all_facts_text = " ".join([f.fact.lower() for f in facts])
-
-        comparative_indicators = ["better than", "worse than", "unlike", "ahead of"]
-        found_comparative = [word for word in comparative_indicators if word in all_facts_text]
-
-        assert len(found_comparative) >= 1, (
-            f"Should preserve comparative dimension. "
-            f"Found: {found_comparative}"
-        )
-
-    @pytest.mark.asyncio
-    async def test_attitudinal_reactive_dimension(self):
-        """Test that attitudes and reactions are preserved."""
-        text = """
+""",
+        "Project review",
+        ["better than", "worse than", "unlike", "ahead of"],
+        1,
+    ),
+    "attitudinal": (
+        """
 She's very skeptical about the new technology.
 I was surprised when he announced his resignation.
 Marcus rolled his eyes when the topic came up.
 She's enthusiastic about the opportunity.
-"""
+""",
+        "Team meeting",
+        ["skeptical", "surprised", "rolled his eyes", "enthusiastic"],
+        1,
+    ),
+    "intentional": (
+        """
+I want to learn Mandarin before my trip to China.
+She aims to complete her PhD within three years.
+His goal is to build a sustainable business.
+I'm planning to switch careers because I'm not fulfilled in my current role.
+""",
+        "Personal goals discussion",
+        [
+            "want", "aim", "goal", "plan", "because", "learn", "complete",
+            "build", "switch", "career", "mandarin", "china", "phd", "business",
+        ],
+        1,
+    ),
+    "evaluative": (
+        """
+I prefer working remotely to being in an office.
+She values honesty above all else.
+He hates being late to meetings.
+Family is the most important thing to her.
+""",
+        "Personal values discussion",
+        ["prefer", "values", "hates", "important", "above all"],
+        2,
+    ),
+}
 
-        context = "Team meeting"
-        llm_config = LLMConfig.from_env()
 
-        facts, _, _ = await extract_facts_from_text(
-            text=text,
-            event_date=datetime(2024, 11, 13),
-            context=context,
-            llm_config=llm_config,
-            agent_name="TestUser",
-            config=_get_raw_config(),
-        )
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def dimension_extractions(gather_extractions, fast_llm_config, extraction_config):
+    """
+    Extract every DIMENSION_CASES input in one batch and return facts by dimension.
 
-        assert len(facts) > 0, "Should extract at least one fact"
+    The dimension tests only differ in their short input text, so the class
+    awaits a single gathered batch instead of one LLM round-trip per test.
+    Indicator-presence checks tolerate a weaker model, so this uses
+    ``fast_llm_config``; test_comprehensive_multi_dimension keeps the main model
+    as the quality gate.
+    """
+    cases = {
+        name: dict(text=text, event_date=DIMENSION_EVENT_DATE, context=context, agent_name="TestUser")
+        for name, (text, context, _, _) in DIMENSION_CASES.items()
+    }
+    return await gather_extractions(cases, fast_llm_config, extraction_config)
 
-        all_facts_text = " ".join([f.fact.lower() for f in facts])
 
-        attitudinal_indicators = ["skeptical", "surprised", "rolled his eyes", "enthusiastic"]
-        found_attitudinal = [word for word in attitudinal_indicators if word in all_facts_text]
+@functools.lru_cache(maxsize=None)
+def _terms_re(terms: frozenset[str]) -> re.Pattern:
+    """Compile a case-insensitive alternation of literal terms, cached per term set."""
+    # Longest first so a term that contains another (e.g. "positive feedback"
+    # vs "positive") is reported when it matches.
+    return re.compile("|".join(map(re.escape, sorted(terms, key=len, reverse=True))), re.IGNORECASE)
 
-        assert len(found_attitudinal) >= 1, (
-            f"Should preserve attitudinal/reactive dimension. "
-            f"Found: {found_attitudinal}"
-        )
 
-    @pytest.mark.asyncio
-    async def test_intentional_motivational_dimension(self):
-        """Test that goals, plans, and motivations are preserved."""
-        text = """
-I want to learn Mandarin before my trip to China.
-She aims to complete her PhD within three years.
-His goal is to build a sustainable business.
-I'm planning to switch careers because I'm not fulfilled in my current role.
-"""
+def _contains_any(facts, terms) -> bool:
+    """Return True as soon as any term occurs in a fact (case-insensitive)."""
+    pattern = _terms_re(frozenset(terms))
+    return any(pattern.search(f.fact) for f in facts)
 
-        context = "Personal goals discussion"
-        llm_config = LLMConfig.from_env()
 
-        facts, _, _ = await extract_facts_from_text(
-            text=text,
-            event_date=datetime(2024, 11, 13),
-            context=context,
-            llm_config=llm_config,
-            agent_name="TestUser",
-            config=_get_raw_config(),
-        )
+def _found(facts, indicators) -> set[str]:
+    """
+    Return the indicators (lowercased) that occur in any fact, case-insensitively.
 
-        assert len(facts) > 0, "Should extract at least one fact"
+    One compiled alternation scans each fact once instead of joining all facts
+    into a lowered string and running a substring search per indicator.
+    """
+    pattern = _terms_re(frozenset(indicators))
+    seen: set[str] = set()
+    for f in facts:
+        seen.update(m.group(0).lower() for m in pattern.finditer(f.fact))
+    return seen
 
-        all_facts_text = " ".join([f.fact.lower() for f in facts])
 
-        # Check for goal/intention related content
-        intentional_indicators = [
-            "want", "aim", "goal", "plan", "because", "learn", "complete",
-            "build", "switch", "career", "mandarin", "china", "phd", "business"
-        ]
-        found_intentional = [word for word in intentional_indicators if word in all_facts_text]
+# Word lists for test_comprehensive_multi_dimension, compiled once at import
+_EMOTIONAL_RE = re.compile(r"thrilled|positive|feedback|enthusiastic", re.IGNORECASE)
+_VAGUE_TEMPORAL_RE = re.compile(r"\b(?:recently|soon|lately)\b", re.IGNORECASE)
+_PREFERENCE_RE = re.compile(r"prefer|rather than|in person|virtually|read the room", re.IGNORECASE)
 
-        assert len(found_intentional) >= 1, (
-            f"Should preserve intentional/motivational content. "
-            f"Found: {found_intentional}"
-        )
 
-    @pytest.mark.asyncio
-    async def test_evaluative_preferential_dimension(self):
-        """Test that preferences and values are preserved."""
-        text = """
-I prefer working remotely to being in an office.
-She values honesty above all else.
-He hates being late to meetings.
-Family is the most important thing to her.
-"""
+def _matches(facts, pattern: re.Pattern) -> set[str]:
+    """Return the distinct (lowercased) matches of a compiled pattern across all facts."""
+    return {m.lower() for f in facts for m in pattern.findall(f.fact)}
 
-        context = "Personal values discussion"
-        llm_config = LLMConfig.from_env()
 
-        facts, _, _ = await extract_facts_from_text(
-            text=text,
-            event_date=datetime(2024, 11, 13),
-            context=context,
-            llm_config=llm_config,
-            agent_name="TestUser",
-            config=_get_raw_config(),
-        )
+@pytest.mark.xdist_group("fact_extraction_dimensions")
+class TestDimensionPreservation:
+    """Tests that fact extraction preserves all information dimensions."""
 
-        assert len(facts) > 0, "Should extract at least one fact"
+    @pytest.mark.parametrize("dimension", list(DIMENSION_CASES))
+    def test_dimension_preservation(self, dimension_extractions, dimension):
+        """
+        Test that each information dimension survives extraction.
+
+        E.g. emotional: "I was thrilled to receive positive feedback" should NOT
+        become "I received positive feedback"; likewise sensory details, certainty
+        levels, skills, comparisons, attitudes, goals and preferences must be kept.
+        """
+        _, _, indicators, min_found = DIMENSION_CASES[dimension]
+        facts = facts_for(dimension_extractions, dimension)
 
-        all_facts_text = " ".join([f.fact.lower() for f in facts])
+        assert len(facts) > 0, "Should extract at least one fact"
 
-        evaluative_indicators = ["prefer", "values", "hates", "important", "above all"]
-        found_evaluative = [word for word in evaluative_indicators if word in all_facts_text]
+        found = _found(facts, indicators)
 
-        assert len(found_evaluative) >= 2, (
-            f"Should preserve evaluative/preferential dimension. "
-            f"Found: {found_evaluative}"
+        assert len(found) >= min_found, (
+            f"Should preserve {dimension} dimension. "
+            f"Found: {found}, Expected at least {min_found} from: {indicators}"
         )
 
     @pytest.mark.hs_llm_mat
     @pytest.mark.asyncio
-    async def test_comprehensive_multi_dimension(self):
+    async def test_comprehensive_multi_dimension(self, cached_extract_facts, llm_config, extraction_config):
         """Test a realistic scenario with multiple dimensions in one fact."""
         text = """
 I was thrilled to receive such positive feedback on my presentation yesterday!
@@ -316,84 +221,266 @@ I prefer presenting in person rather than virtually because I can read the room
 """
 
         context = "Personal reflection"
-        llm_config = LLMConfig.from_env()
 
-        event_date = datetime(2024, 11, 13)
-
-        facts, _, _ = await extract_facts_from_text(
+        facts, _, _ = await cached_extract_facts(
             text=text,
-            event_date=event_date,
+            event_date=DIMENSION_EVENT_DATE,
             context=context,
             llm_config=llm_config,
             agent_name="TestUser",
-            config=_get_raw_config(),
+            config=extraction_config,
         )
 
         assert len(facts) > 0, "Should extract at least one fact"
 
-        all_facts_text = " ".join([f.fact.lower() for f in facts])
-
         # Check emotional - should capture positive/thrilled sentiment
-        has_emotional = any(term in all_facts_text for term in [
-            "thrilled", "positive feedback", "positive", "feedback", "enthusiastic"
-        ])
-        assert has_emotional, "Should preserve emotional dimension"
+        assert _matches(facts, _EMOTIONAL_RE), "Should preserve emotional dimension"
 
         # Check no vague temporal terms
-        prohibited_terms = ["recently", "soon", "lately"]
-        found_prohibited = [term for term in prohibited_terms if term in all_facts_text]
+        found_prohibited = _matches(facts, _VAGUE_TEMPORAL_RE)
         assert len(found_prohibited) == 0, \
             f"Should NOT use vague temporal terms. Found: {found_prohibited}"
 
         # Check preference - should capture the in-person vs virtual preference
-        has_preference = any(term in all_facts_text for term in [
-            "prefer", "rather than", "in person", "virtually", "read the room"
-        ])
+        has_preference = bool(_matches(facts, _PREFERENCE_RE))
         assert has_preference, "Should preserve preferential dimension"
 
 
+# =============================================================================
+# SHARED EXTRACTIONS FOR TEMPORAL / INFERENCE / CLASSIFICATION TESTS
+# =============================================================================
+
+# Inputs keyed by case name: (text, event_date, context, agent_name). Every case
+# is extracted together by the ``quality_extractions`` fixture; each test then
+# asserts on the facts of its own case.
+QUALITY_CASES = {
+    "temporal_absolute": (
+        """
+Yesterday I went for a morning jog for the first time in a nearby park.
+Last week I started a new project.
+I'm planning to visit Tokyo next month.
+""",
+        NOV_13_2024,
+        "Personal conversation",
+        "TestUser",
+    ),
+    "last_night": (
+        """
+Melanie: Hey Caroline! Last night was amazing! We celebrated my daughter's birthday
+with a concert surrounded by music, joy and the warm summer breeze.
+""",
+        datetime(2023, 8, 14, 14, 24),
+        "Conversation between Melanie and Caroline",
+        "Melanie",
+    ),
+    "yesterday": (
+        """
+Yesterday I went for a morning jog for the first time in a nearby park.
+It was a beautiful day and I plan to make this a regular habit.
+""",
+        NOV_13_2024,
+        "Personal diary",
+        "TestUser",
+    ),
+    "relative_dates": (
+        """
+        Yesterday I went hiking in Yosemite.
+        Last week I started my new job at Google.
+        This morning I had coffee with Alice.
+        """,
+        MAR_20_2024_UTC,
+        "Personal diary",
+        "TestUser",
+    ),
+    "no_temporal_info": (
+        "Alice works at Google. She loves Python programming.",
+        MAR_20_2024_UTC,
+        "General info",
+        "TestUser",
+    ),
+    "absolute_dates": (
+        """
+        On March 15, 2024, Alice joined Google.
+        Bob will start his vacation on April 1st.
+        """,
+        MAR_20_2024_UTC,
+        "Calendar events",
+        "TestUser",
+    ),
+    "identity_connection": (
+        """
+Deborah: The roses and dahlias bring me peace. I lost a friend last week,
+so I've been spending time in the garden to find some comfort.
+
+Jolene: Sorry to hear about your friend, Deb. Losing someone can be really tough.
+How are you holding up?
+
+Deborah: Thanks for the kind words. It's been tough, but I'm comforted by
+remembering our time together. It reminds me of how special life is.
+
+Jolene: Memories can give us so much comfort and joy.
+
+Deborah: Memories keep our loved ones close. This is the last photo with Karlie
+which was taken last summer when we hiked. It was our last one. We had such a
+great time! Every time I see it, I can't help but smile.
+""",
+        datetime(2023, 2, 23),
+        "Conversation between Deborah and Jolene",
+        "Deborah",
+    ),
+    "pronoun_resolution": (
+        """
+I started a new machine learning project last month.
+It's been really challenging but very rewarding.
+I've learned so much from it.
+""",
+        NOV_13_2024,
+        "Personal update",
+        "TestUser",
+    ),
+    "podcast_agent": (
+        """
+Marcus: I've been working on AI safety research for the past six months.
+Jamie: That's really interesting! What specifically are you focusing on?
+Marcus: I'm investigating interpretability methods. I believe we need to understand
+how models make decisions before we can trust them in critical applications.
+Jamie: I completely agree with that approach.
+Marcus: I published a paper on this topic last month, and I'm presenting it at
+the conference next week.
+Jamie: Congratulations! I'd love to read it.
+""",
+        NOV_13_2024,
+        "Podcast episode between you (Marcus) and Jamie discussing AI research",
+        "Marcus",
+    ),
+    "work_log": (
+        """
+I completed the project on machine learning interpretability last week.
+My colleague Sarah helped me with the data analysis.
+We presented our findings to the team yesterday.
+""",
+        NOV_13_2024,
+        "Personal work log",
+        "TestUser",
+    ),
+    "speaker_predictions": (
+        """
+Marcus: [excited] I'm calling it now, Rams will win twenty seven to twenty four, their defense is too strong!
+Jamie: [laughs] No way, I predict the Niners will win twenty seven to thirteen, comfy win at home.
+Marcus: [angry] That's ridiculous, I stand by my Rams prediction.
+Jamie: [teasing] We'll see who's right, my Niners pick is solid.
+""",
+        datetime(2024, 11, 14),
+        "podcast episode on match prediction of week 10 - Marcus (you) and Jamie - 14 nov",
+        "Marcus",
+    ),
+    "podcast_meta": (
+        """
+Marcus: Welcome everyone to today's episode! Before we dive in, don't forget to
+subscribe and leave a rating.
+
+Marcus: Today I want to talk about my research on interpretability in AI systems.
+I've been working on this for about a year now.
+
+Jamie: That sounds really interesting! What made you focus on that area?
+
+Marcus: I believe it's crucial for AI safety. We need to understand how these
+models make decisions before we can trust them in critical applications.
+
+Jamie: I completely agree with that approach.
+
+Marcus: Well, I think that's gonna do it for us today! Thanks for listening everyone.
+Don't forget to tap follow or subscribe, tell a friend, and drop a quick rating
+so the algorithm learns to box out. See you next week!
+""",
+        NOV_13_2024,
+        "Podcast episode between you (Marcus) and Jamie about AI",
+        "Marcus",
+    ),
+}
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def quality_extractions(gather_extractions, llm_config, extraction_config):
+    """
+    Extract every QUALITY_CASES input in one batch and return facts by case name.
+
+    The providers expose no multi-prompt endpoint, so the batch is an asyncio.gather
+    over the cached extractor: the temporal, inference and classification classes
+    pay about one LLM round-trip instead of one per test.
+    """
+    cases = {
+        name: dict(text=text, event_date=event_date, context=context, agent_name=agent_name)
+        for name, (text, event_date, context, agent_name) in QUALITY_CASES.items()
+    }
+    return await gather_extractions(cases, llm_config, extraction_config)
+
+
+# Total attempts for checks that are sensitive to LLM nondeterminism
+MAX_EXTRACTION_ATTEMPTS = 3
+
+
+@pytest.fixture(scope="module")
+def check_with_retries(quality_extractions, cached_extract_facts, llm_config, extraction_config):
+    """
+    Return ``check(case, assert_facts)``, which asserts on a case and retries on failure.
+
+    The first attempt uses the gathered ``quality_extractions`` facts. If the
+    extraction or the assertions fail, the case is re-extracted with the cache
+    bypassed, up to MAX_EXTRACTION_ATTEMPTS attempts in total.
+    """
+
+    async def check(case, assert_facts):
+        text, event_date, context, agent_name = QUALITY_CASES[case]
+        for attempt in range(MAX_EXTRACTION_ATTEMPTS):
+            try:
+                if attempt == 0:
+                    facts = facts_for(quality_extractions, case)
+                else:
+                    facts, _, _ = await cached_extract_facts(
+                        text=text,
+                        event_date=event_date,
+                        context=context,
+                        llm_config=llm_config,
+                        agent_name=agent_name,
+                        config=extraction_config,
+                        refresh=True,
+                    )
+                assert_facts(facts)
+                return
+            except Exception as e:
+                if attempt == MAX_EXTRACTION_ATTEMPTS - 1:
+                    raise
+                print(f"Test attempt {attempt + 1} failed: {e}. Retrying...")
+
+    return check
+
+
 # =============================================================================
 # TEMPORAL CONVERSION TESTS
 # =============================================================================
 
+# Vague phrases that relative dates must not be rewritten into
+_VAGUE_TEMPORAL_PHRASES_RE = re.compile(r"recently|lately|a while ago|some time ago", re.IGNORECASE)
+
+
+@pytest.mark.xdist_group("fact_extraction_quality")
 class TestTemporalConversion:
     """Tests for temporal extraction and date conversion."""
 
-    @pytest.mark.asyncio
-    async def test_temporal_absolute_conversion(self):
+    def test_temporal_absolute_conversion(self, quality_extractions):
         """
         Test that relative temporal expressions are converted to absolute dates.
 
         Critical: "yesterday" should become "on November 12, 2024", NOT "recently"
         LLM behavior may vary, so we check the occurred_start field rather than fact text.
         """
-        text = """
-Yesterday I went for a morning jog for the first time in a nearby park.
-Last week I started a new project.
-I'm planning to visit Tokyo next month.
-"""
-
-        context = "Personal conversation"
-        llm_config = LLMConfig.from_env()
-
-        event_date = datetime(2024, 11, 13)
-
-        facts, _, _ = await extract_facts_from_text(
-            text=text,
-            event_date=event_date,
-            context=context,
-            llm_config=llm_config,
-            agent_name="TestUser",
-            config=_get_raw_config(),
-        )
+        facts = facts_for(quality_extractions, "temporal_absolute")
 
         assert len(facts) > 0, "Should extract at least one fact"
 
-        all_facts_text = " ".join([f.fact.lower() for f in facts])
-
         # Should NOT contain vague temporal terms
-        prohibited_terms = ["recently", "lately", "a while ago", "some time ago"]
-        found_prohibited = [term for term in prohibited_terms if term in all_facts_text]
+        found_prohibited = _matches(facts, _VAGUE_TEMPORAL_PHRASES_RE)
 
         assert len(found_prohibited) == 0, (
             f"Should NOT use vague temporal terms. Found: {found_prohibited}"
@@ -406,195 +493,76 @@ I'm planning to visit Tokyo next month.
             f"Facts: {[f.fact for f in facts]}"
         )
 
-    @pytest.mark.asyncio
-    async def test_date_field_calculation_last_night(self):
+    @pytest.mark.parametrize(
+        "case, terms, year, month, days",
+        [
+            # "Last night" on Aug 14, 2023: the birthday fact must carry a date, ideally
+            # Aug 13; 14 (the conversation date) is accepted as the LLM may vary.
+            ("last_night", ("birthday", "concert"), 2023, 8, (13, 14)),
+            # "Yesterday" on Nov 13, 2024: if any fact carries a date it should be
+            # Nov 12, or 13 (the conversation date).
+            ("yesterday", None, 2024, 11, (12, 13)),
+        ],
+    )
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_date_field_calculation(self, check_with_retries, case, terms, year, month, days):
         """
-        Test that the date field is calculated correctly for "last night" events.
-
-        Ideally: If conversation is on August 14, 2023 and text says "last night",
-        the date field should be August 13. We accept 13 or 14 as LLM may vary.
+        Test that the date field is calculated correctly for relative-date events.
 
+        With ``terms``, the fact mentioning one of them must exist and have
+        occurred_start; without, the first dated fact (if any) is checked.
         Retries up to 3 times to account for LLM inconsistencies.
         """
-        text = """
-Melanie: Hey Caroline! Last night was amazing! We celebrated my daughter's birthday
-with a concert surrounded by music, joy and the warm summer breeze.
-"""
-
-        context = "Conversation between Melanie and Caroline"
-        llm_config = LLMConfig.from_env()
-        event_date = datetime(2023, 8, 14, 14, 24)
-
-        last_error = None
-        max_retries = 3
-
-        for attempt in range(max_retries):
-            try:
-                facts, _, _ = await extract_facts_from_text(
-                    text=text,
-                    event_date=event_date,
-                    context=context,
-                    llm_config=llm_config,
-                    agent_name="Melanie",
-                    config=_get_raw_config(),
-                )
-
-                assert len(facts) > 0, "Should extract at least one fact"
-
-                birthday_fact = None
-                for fact in facts:
-                    if "birthday" in fact.fact.lower() or "concert" in fact.fact.lower():
-                        birthday_fact = fact
-                        break
-
-                assert birthday_fact is not None, "Should extract fact about birthday celebration"
-
-                fact_date_str = birthday_fact.occurred_start
-                assert fact_date_str is not None, "occurred_start should not be None for temporal events"
-
-                if 'T' in fact_date_str:
-                    fact_date = datetime.fromisoformat(fact_date_str.replace('Z', '+00:00'))
-                else:
-                    fact_date = datetime.fromisoformat(fact_date_str)
-
-                assert fact_date.year == 2023, "Year should be 2023"
-                assert fact_date.month == 8, "Month should be August"
-                # Accept day 13 (ideal: last night) or 14 (conversation date) as valid
-                assert fact_date.day in (13, 14), (
-                    f"Day should be 13 or 14 (around Aug 14 event), but got {fact_date.day}."
-                )
-
-                # If we reach here, test passed
-                return
-
-            except AssertionError as e:
-                last_error = e
-                if attempt < max_retries - 1:
-                    print(f"Test attempt {attempt + 1} failed: {e}. Retrying...")
-                    continue
-                else:
-                    # Last attempt failed, re-raise the error
-                    raise e
-            except Exception as e:
-                last_error = e
-                if attempt < max_retries - 1:
-                    print(f"Test attempt {attempt + 1} failed with exception: {e}. Retrying...")
-                    continue
-                else:
-                    # Last attempt failed, re-raise the error
-                    raise e
-
-        # Should not reach here, but just in case
-        if last_error:
-            raise last_error
-
-    @pytest.mark.asyncio
-    async def test_date_field_calculation_yesterday(self):
-        """Test that the date field is calculated correctly for "yesterday" events."""
-        text = """
-Yesterday I went for a morning jog for the first time in a nearby park.
-It was a beautiful day and I plan to make this a regular habit.
-"""
 
-        context = "Personal diary"
-        llm_config = LLMConfig.from_env()
+        def assert_date_field(facts):
+            assert len(facts) > 0, "Should extract at least one fact"
 
-        event_date = datetime(2024, 11, 13)
-
-        facts, _, _ = await extract_facts_from_text(
-            text=text,
-            event_date=event_date,
-            context=context,
-            llm_config=llm_config,
-            agent_name="TestUser",
-            config=_get_raw_config(),
-        )
+            if terms is None:
+                dated_fact = next((f for f in facts if f.occurred_start), None)
+                if dated_fact is None:
+                    return
+            else:
+                dated_fact = next((f for f in facts if _contains_any([f], terms)), None)
+                assert dated_fact is not None, f"Should extract a fact mentioning one of {terms}"
+                assert dated_fact.occurred_start is not None, "occurred_start should not be None for temporal events"
 
-        assert len(facts) > 0, "Should extract at least one fact"
+            fact_date = datetime.fromisoformat(dated_fact.occurred_start)
 
-        # Find a fact with occurred_start
-        facts_with_date = [f for f in facts if f.occurred_start]
+            assert fact_date.year == year, f"Year should be {year}"
+            assert fact_date.month == month, f"Month should be {month}"
+            assert fact_date.day in days, f"Day should be one of {days}, but got {fact_date.day}."
 
-        # If we got a fact with temporal data, verify the date is reasonable
-        if facts_with_date:
-            jogging_fact = facts_with_date[0]
-            fact_date_str = jogging_fact.occurred_start
-            if 'T' in fact_date_str:
-                fact_date = datetime.fromisoformat(fact_date_str.replace('Z', '+00:00'))
-            else:
-                fact_date = datetime.fromisoformat(fact_date_str)
+        await check_with_retries(case, assert_date_field)
 
-            assert fact_date.year == 2024, "Year should be 2024"
-            assert fact_date.month == 11, "Month should be November"
-            # Accept day 12 (ideal: yesterday) or 13 (conversation date) as valid
-            assert fact_date.day in (12, 13), (
-                f"Day should be 12 or 13 (around Nov 13 event), but got {fact_date.day}."
-            )
-
-        all_facts_text = " ".join([f.fact.lower() for f in facts])
+    def test_yesterday_converted_in_fact_text(self, quality_extractions):
+        """Test that "yesterday" survives as content and becomes an absolute date in the fact text."""
+        facts = facts_for(quality_extractions, "yesterday")
 
         # The content should be preserved in some form
-        assert any(term in all_facts_text for term in ["jog", "morning", "park", "first"]), \
+        assert _contains_any(facts, ["jog", "morning", "park", "first"]), \
             f"Should preserve key content. Facts: {[f.fact for f in facts]}"
 
-        assert "recently" not in all_facts_text, \
+        assert not _contains_any(facts, ["recently"]), \
             "Should NOT convert 'yesterday' to 'recently'"
 
-        assert any(term in all_facts_text for term in ["november", "12", "nov"]), \
+        assert _contains_any(facts, ["november", "12", "nov"]), \
             "Should convert 'yesterday' to absolute date in fact text"
 
-    @pytest.mark.asyncio
-    async def test_extract_facts_with_relative_dates(self):
+    def test_extract_facts_with_relative_dates(self, quality_extractions):
         """Test that relative dates are converted to absolute dates."""
-
-        reference_date = datetime(2024, 3, 20, 14, 0, 0, tzinfo=UTC)
-        llm_config = LLMConfig.from_env()
-
-        text = """
-        Yesterday I went hiking in Yosemite.
-        Last week I started my new job at Google.
-        This morning I had coffee with Alice.
-        """
-
-        facts, _, _ = await extract_facts_from_text(
-            text=text,
-            event_date=reference_date,
-            llm_config=llm_config,
-            agent_name="TestUser",
-            context="Personal diary",
-            config=_get_raw_config(),
-        )
+        facts = facts_for(quality_extractions, "relative_dates")
 
         assert len(facts) > 0, "Should extract at least one fact"
 
         for fact in facts:
             assert fact.fact, "Each fact should have 'fact' field"
 
-        # Check that facts were extracted - dates may or may not be populated
-        # depending on LLM behavior
-        dates = [f.occurred_start for f in facts if f.occurred_start]
-        # If dates were extracted, they should ideally be different for different events
-        if len(dates) >= 2:
-            unique_dates = set(dates)
-            # Just verify we got dates, don't require them to be unique
+        # Dates may or may not be populated depending on LLM behavior. If they are,
+        # they should ideally differ per event, but uniqueness is not required.
 
-    @pytest.mark.asyncio
-    async def test_extract_facts_with_no_temporal_info(self):
+    def test_extract_facts_with_no_temporal_info(self, quality_extractions):
         """Test that facts without temporal info are still extracted."""
-
-        reference_date = datetime(2024, 3, 20, 14, 0, 0, tzinfo=UTC)
-        llm_config = LLMConfig.from_env()
-
-        text = "Alice works at Google. She loves Python programming."
-
-        facts, _, _ = await extract_facts_from_text(
-            text=text,
-            event_date=reference_date,
-            llm_config=llm_config,
-            agent_name="TestUser",
-            context="General info",
-            config=_get_raw_config(),
-        )
+        facts = facts_for(quality_extractions, "no_temporal_info")
 
         assert len(facts) > 0, "Should extract at least one fact"
 
@@ -603,26 +571,9 @@ It was a beautiful day and I plan to make this a regular habit.
         for fact in facts:
             assert fact.fact, "Each fact should have text content"
 
-    @pytest.mark.asyncio
-    async def test_extract_facts_with_absolute_dates(self):
+    def test_extract_facts_with_absolute_dates(self, quality_extractions):
         """Test that absolute dates in text are preserved."""
-
-        reference_date = datetime(2024, 3, 20, 14, 0, 0, tzinfo=UTC)
-        llm_config = LLMConfig.from_env()
-
-        text = """
-        On March 15, 2024, Alice joined Google.
-        Bob will start his vacation on April 1st.
-        """
-
-        facts, _, _ = await extract_facts_from_text(
-            text=text,
-            event_date=reference_date,
-            llm_config=llm_config,
-            agent_name="TestUser",
-            context="Calendar events",
-            config=_get_raw_config(),
-        )
+        facts = facts_for(quality_extractions, "absolute_dates")
 
         assert len(facts) > 0, "Should extract at least one fact"
 
@@ -634,105 +585,69 @@ It was a beautiful day and I plan to make this a regular habit.
 # LOGICAL INFERENCE TESTS
 # =============================================================================
 
+# Terms for the inference tests, checked per fact
+_LOSS_WORDS = ("lost", "death", "passed", "died", "losing", "friend")
+_PROJECT_QUALITY_WORDS = ("challenging", "rewarding", "learned")
+
+
+@pytest.mark.xdist_group("fact_extraction_quality")
 class TestLogicalInference:
     """Tests that the system makes logical inferences to connect related information."""
 
-    @pytest.mark.asyncio
-    async def test_logical_inference_identity_connection(self):
+    def test_logical_inference_identity_connection(self, quality_extractions):
         """
         Test that the system extracts key information about loss and relationships.
 
         The LLM should extract facts about losing a friend and about Karlie.
         Ideally it connects them, but we accept extracting both separately.
         """
-        text = """
-Deborah: The roses and dahlias bring me peace. I lost a friend last week,
-so I've been spending time in the garden to find some comfort.
-
-Jolene: Sorry to hear about your friend, Deb. Losing someone can be really tough.
-How are you holding up?
-
-Deborah: Thanks for the kind words. It's been tough, but I'm comforted by
-remembering our time together. It reminds me of how special life is.
-
-Jolene: Memories can give us so much comfort and joy.
-
-Deborah: Memories keep our loved ones close. This is the last photo with Karlie
-which was taken last summer when we hiked. It was our last one. We had such a
-great time! Every time I see it, I can't help but smile.
-"""
-
-        context = "Conversation between Deborah and Jolene"
-        llm_config = LLMConfig.from_env()
-
-        event_date = datetime(2023, 2, 23)
-
-        facts, _, _ = await extract_facts_from_text(
-            text=text,
-            event_date=event_date,
-            context=context,
-            llm_config=llm_config,
-            agent_name="Deborah",
-            config=_get_raw_config(),
-        )
+        facts = facts_for(quality_extractions, "identity_connection")
 
         assert len(facts) > 0, "Should extract at least one fact"
 
-        all_facts_text = " ".join([f.fact.lower() for f in facts])
-
-        # Check that key information is extracted (Karlie and the loss)
-        has_karlie = "karlie" in all_facts_text
-        has_loss = any(word in all_facts_text for word in ["lost", "death", "passed", "died", "losing", "friend"])
-        has_hike = "hike" in all_facts_text or "hiking" in all_facts_text or "photo" in all_facts_text
-
-        # At minimum, we should capture Karlie and either the loss or the hike memory
-        assert has_karlie or has_loss, (
-            f"Should mention either Karlie or the loss in facts. Facts: {[f.fact for f in facts]}"
-        )
-
-        # Check if inference was made (bonus - not required for pass)
-        connected_fact_found = False
+        # One pass: whether Karlie and the loss are mentioned at all, and whether
+        # a single fact connects them (the inference, a bonus - not required for pass)
+        has_karlie = has_loss = connected_fact_found = False
         for fact in facts:
             fact_text = fact.fact.lower()
-            if "karlie" in fact_text and any(word in fact_text for word in ["lost", "death", "passed", "died", "losing", "friend"]):
+            fact_has_karlie = "karlie" in fact_text
+            fact_has_loss = any(word in fact_text for word in _LOSS_WORDS)
+            has_karlie |= fact_has_karlie
+            has_loss |= fact_has_loss
+            if fact_has_karlie and fact_has_loss:
                 connected_fact_found = True
                 break
 
+        # At minimum, we should capture Karlie or the loss
+        assert has_karlie or has_loss, (
+            f"Should mention either Karlie or the loss in facts. Facts: {[f.fact for f in facts]}"
+        )
+
         # This is informational - test passes even without perfect inference
         if not connected_fact_found and has_karlie and has_loss:
             pass  # Acceptable: facts extracted separately
 
-    @pytest.mark.asyncio
-    async def test_logical_inference_pronoun_resolution(self):
+    def test_logical_inference_pronoun_resolution(self, quality_extractions):
         """
         Test that pronouns are resolved to their referents.
 
         Example: "I started a project" + "It's challenging" -> "The project is challenging"
         """
-        text = """
-I started a new machine learning project last month.
-It's been really challenging but very rewarding.
-I've learned so much from it.
-"""
-
-        context = "Personal update"
-        llm_config = LLMConfig.from_env()
-
-        facts, _, _ = await extract_facts_from_text(
-            text=text,
-            event_date=datetime(2024, 11, 13),
-            context=context,
-            llm_config=llm_config,
-            agent_name="TestUser",
-            config=_get_raw_config(),
-        )
+        facts = facts_for(quality_extractions, "pronoun_resolution")
 
         assert len(facts) > 0, "Should extract at least one fact"
 
-        all_facts_text = " ".join([f.fact.lower() for f in facts])
-
-        has_project = "project" in all_facts_text
-        has_qualities = any(word in all_facts_text for word in ["challenging", "rewarding", "learned"])
+        # One pass collecting every signal used below
+        has_project = has_qualities = project_with_quality = False
+        project_fact_count = 0
+        for fact in facts:
+            fact_text = fact.fact.lower()
+            fact_has_project = "project" in fact_text
+            fact_has_quality = any(word in fact_text for word in _PROJECT_QUALITY_WORDS)
+            has_project |= fact_has_project
+            has_qualities |= fact_has_quality
+            project_with_quality |= fact_has_project and fact_has_quality
+            project_fact_count += fact_has_project
 
         assert has_project, "Should mention the project"
         assert has_qualities, "Should mention the qualities/learning"
@@ -741,14 +656,9 @@ I've learned so much from it.
         # 1. "project" appears with characteristics in same fact, OR
         # 2. "project" is explicitly mentioned in multiple facts (showing pronoun resolution)
         # The key is that "it" should be resolved to "project" rather than left as ambiguous
-        project_facts = [f for f in facts if "project" in f.fact.lower()]
-
         # If we have multiple facts mentioning project, pronoun resolution worked
         # (the LLM connected "it" back to "project" in subsequent facts)
-        pronoun_resolved = len(project_facts) >= 2 or any(
-            "project" in f.fact.lower() and any(word in f.fact.lower() for word in ["challenging", "rewarding", "learned"])
-            for f in facts
-        )
+        pronoun_resolved = project_fact_count >= 2 or project_with_quality
 
         assert pronoun_resolved, (
             "Should resolve 'it' to 'the project' - either in combined facts or by mentioning project in multiple facts. "
@@ -760,11 +670,15 @@ I've learned so much from it.
 # FACT CLASSIFICATION TESTS
 # =============================================================================
 
+# Substantive AI-research content expected from the podcast transcripts
+_AI_RESEARCH_RE = re.compile(r"interpretability|ai|safety|research|models|decisions", re.IGNORECASE)
+
+
+@pytest.mark.xdist_group("fact_extraction_quality")
 class TestFactClassification:
     """Tests that facts are correctly classified as agent vs world."""
 
-    @pytest.mark.asyncio
-    async def test_agent_facts_from_podcast_transcript(self):
+    def test_agent_facts_from_podcast_transcript(self, quality_extractions):
         """
         Test that when context identifies someone as 'you', their actions are classified as agent facts.
 
@@ -772,134 +686,48 @@ class TestFactClassification:
         "this was podcast episode between you (Marcus) and Jamie" were extracting
         all facts as 'world' instead of properly identifying Marcus's statements as 'bank'.
         """
-
-        transcript = """
-Marcus: I've been working on AI safety research for the past six months.
-Jamie: That's really interesting! What specifically are you focusing on?
-Marcus: I'm investigating interpretability methods. I believe we need to understand
-how models make decisions before we can trust them in critical applications.
-Jamie: I completely agree with that approach.
-Marcus: I published a paper on this topic last month, and I'm presenting it at
-the conference next week.
-Jamie: Congratulations! I'd love to read it.
-"""
-
-        context = "Podcast episode between you (Marcus) and Jamie discussing AI research"
-
-        llm_config = LLMConfig.from_env()
-
-        facts, _, _ = await extract_facts_from_text(
-            text=transcript,
-            event_date=datetime(2024, 11, 13),
-            llm_config=llm_config,
-            agent_name="Marcus",
-            context=context,
-            config=_get_raw_config(),
-        )
+        facts = facts_for(quality_extractions, "podcast_agent")
 
         assert len(facts) > 0, "Should extract at least one fact from the transcript"
 
         # Check that we extracted meaningful content about AI research
-        all_facts_text = " ".join([f.fact.lower() for f in facts])
-        has_ai_content = any(term in all_facts_text for term in [
+        has_ai_content = _contains_any(facts, [
             "ai", "safety", "interpretability", "research", "paper", "conference", "models"
         ])
         assert has_ai_content, f"Should extract AI research content. Facts: {[f.fact for f in facts]}"
 
-        # Check fact type classification (flexible - may vary by LLM)
-        agent_facts = [f for f in facts if f.fact_type == "agent"]
-        experience_facts = [f for f in facts if f.fact_type == "experience"]
-
-        # Accept either agent or experience facts as valid for first-person statements
-        first_person_facts = agent_facts + experience_facts
+        # Fact type classification varies by LLM (agent or experience for Marcus's
+        # first-person statements), so it is not asserted here
 
-        # If we have agent facts, verify they use first person
-        for agent_fact in agent_facts:
-            fact_text = agent_fact.fact
-            # Allow flexibility - fact may or may not start with "I"
-            if fact_text.startswith("I ") or " I " in fact_text:
-                pass  # Good - uses first person
-
-    @pytest.mark.asyncio
-    async def test_agent_facts_without_explicit_context(self):
+    def test_agent_facts_without_explicit_context(self, quality_extractions):
         """Test that when 'you' is used in the text itself, it gets properly classified."""
-
-        text = """
-I completed the project on machine learning interpretability last week.
-My colleague Sarah helped me with the data analysis.
-We presented our findings to the team yesterday.
-"""
-
-        context = "Personal work log"
-
-        llm_config = LLMConfig.from_env()
-
-        facts, _, _ = await extract_facts_from_text(
-            text=text,
-            event_date=datetime(2024, 11, 13),
-            llm_config=llm_config,
-            agent_name="TestUser",
-            context=context,
-            config=_get_raw_config(),
-        )
+        facts = facts_for(quality_extractions, "work_log")
 
         assert len(facts) > 0, "Should extract facts"
 
-        agent_facts = [f for f in facts if f.fact_type == "agent"]
-
-        assert len(agent_facts) >= 0  # Just verify classification works
-
-    @pytest.mark.asyncio
-    async def test_speaker_attribution_predictions(self):
+    def test_speaker_attribution_predictions(self, quality_extractions):
         """
         Test that predictions made by different speakers are correctly attributed.
 
         This addresses the issue where Jamie's prediction of "Niners 27-13" was being
         incorrectly attributed to Marcus (the agent) in the extracted facts.
         """
-
-        transcript = """
-Marcus: [excited] I'm calling it now, Rams will win twenty seven to twenty four, their defense is too strong!
-Jamie: [laughs] No way, I predict the Niners will win twenty seven to thirteen, comfy win at home.
-Marcus: [angry] That's ridiculous, I stand by my Rams prediction.
-Jamie: [teasing] We'll see who's right, my Niners pick is solid.
-"""
-
-        context = "podcast episode on match prediction of week 10 - Marcus (you) and Jamie - 14 nov"
-        agent_name = "Marcus"
-
-        llm_config = LLMConfig.from_env()
-
-        facts, _, _ = await extract_facts_from_text(
-            text=transcript,
-            event_date=datetime(2024, 11, 14),
-            context=context,
-            llm_config=llm_config,
-            agent_name=agent_name,
-            config=_get_raw_config(),
-        )
+        facts = facts_for(quality_extractions, "speaker_predictions")
 
         assert len(facts) > 0, "Should extract at least one fact"
 
-        # Check that predictions were extracted
-        all_facts_text = " ".join([f.fact.lower() for f in facts])
-
         # Should capture at least some prediction content
-        has_prediction_content = any(term in all_facts_text for term in [
+        has_prediction_content = _contains_any(facts, [
             "rams", "niners", "49ers", "prediction", "win", "predict"
         ])
         assert has_prediction_content, f"Should extract prediction content. Facts: {[f.fact for f in facts]}"
 
         # Ideally, Marcus's prediction should be in agent facts, but we accept
-        # any reasonable extraction of the predictions
-        agent_facts = [f for f in facts if f.fact_type == "agent"]
-        if agent_facts:
-            agent_facts_text = " ".join([f.fact.lower() for f in agent_facts])
-            # If agent facts exist, they should relate to Marcus's statements
-            # (but we don't fail if classification varies)
+        # any reasonable extraction of the predictions. If agent facts exist, they
+        # should relate to Marcus's statements (but we don't fail if classification varies)
 
-    @pytest.mark.asyncio
-    async def test_skip_podcast_meta_commentary(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_skip_podcast_meta_commentary(self, check_with_retries):
         """
         Test that podcast intros, outros, and calls to action are skipped.
 
@@ -909,64 +737,13 @@ Jamie: [teasing] We'll see who's right, my Niners pick is solid.
         Note: LLM fact extraction is non-deterministic, so we retry up to 3 times.
         """
 
-        transcript = """
-Marcus: Welcome everyone to today's episode! Before we dive in, don't forget to
-subscribe and leave a rating.
-
-Marcus: Today I want to talk about my research on interpretability in AI systems.
-I've been working on this for about a year now.
-
-Jamie: That sounds really interesting! What made you focus on that area?
-
-Marcus: I believe it's crucial for AI safety. We need to understand how these
-models make decisions before we can trust them in critical applications.
-
-Jamie: I completely agree with that approach.
-
-Marcus: Well, I think that's gonna do it for us today! Thanks for listening everyone.
-Don't forget to tap follow or subscribe, tell a friend, and drop a quick rating
-so the algorithm learns to box out. See you next week!
-"""
-
-        context = "Podcast episode between you (Marcus) and Jamie about AI"
-
-        llm_config = LLMConfig.from_env()
-
-        max_retries = 3
-        last_error = None
-
-        for attempt in range(max_retries):
-            try:
-                facts, _, _ = await extract_facts_from_text(
-                    text=transcript,
-                    event_date=datetime(2024, 11, 13),
-                    llm_config=llm_config,
-                    agent_name="Marcus",
-                    context=context,
-                    config=_get_raw_config(),
-                )
-
-                assert len(facts) > 0, "Should extract at least one fact"
-
-                # The main goal is to extract substantive content about AI research
-                # Meta-commentary filtering is ideal but not strictly required
-                all_facts_text = " ".join([f.fact.lower() for f in facts])
-
-                # Should extract the actual AI research content
-                has_substantive_content = any(term in all_facts_text for term in [
-                    "interpretability", "ai", "safety", "research", "models", "decisions"
-                ])
-                assert has_substantive_content, \
-                    f"Should extract substantive AI research content. Facts: {[f.fact for f in facts]}"
-
-                return  # Test passed
-
-            except AssertionError as e:
-                last_error = e
-                if attempt < max_retries - 1:
-                    print(f"Test attempt {attempt + 1} failed: {e}. Retrying...")
-                    continue
-                else:
-                    raise e
+        def assert_substantive_content(facts):
+            assert len(facts) > 0, "Should extract at least one fact"
 
+            # The main goal is to extract substantive content about AI research
+            # Meta-commentary filtering is ideal but not strictly required
+            has_substantive_content = bool(_matches(facts, _AI_RESEARCH_RE))
+            assert has_substantive_content, \
+                f"Should extract substantive AI research content. Facts: {[f.fact for f in facts]}"
 
+        await check_with_retries("podcast_meta", assert_substantive_content)
@@ -4,12 +4,42 @@ Tests for LinkExpansion graph retrieval.
 Tests cover the entity-based graph traversal for observations.
 """
 
-from datetime import datetime, timezone
+import asyncio
+import uuid
 
 import pytest
-
-
-@pytest.fixture(autouse=True)
+import pytest_asyncio
+
+from hindsight_api import RequestContext
+from hindsight_api.engine.memory_engine import Budget
+
+# Both tests read from one module-scoped bank, so keep them on the same xdist
+# worker to ingest the corpus once.
+pytestmark = pytest.mark.xdist_group("link_expansion_retrieval")
+
+# Two Python developers connected via the shared "Python" entity plus one
+# unrelated distractor. The tests only verify the entity traversal path runs,
+# not that semantic search misses Bob, so no larger dilution corpus is needed.
+LINK_CORPUS = [
+    {
+        "content": "Alice works with Python at TechCorp building REST APIs",
+        "context": "employee info",
+        "entities": [{"text": "Python"}, {"text": "Alice"}, {"text": "TechCorp"}],
+    },
+    {
+        "content": "Bob uses Python at DataSoft for machine learning models",
+        "context": "employee info",
+        "entities": [{"text": "Python"}, {"text": "Bob"}, {"text": "DataSoft"}],
+    },
+    {
+        "content": "The weather in San Francisco is often foggy and cool",
+        "context": "weather info",
+        "entities": [{"text": "San Francisco"}],
+    },
+]
+
+
+@pytest.fixture(scope="module", autouse=True)
 def enable_observations():
     """Enable observations for all tests in this module."""
     from hindsight_api.config import _get_raw_config
@@ -21,8 +51,26 @@ def enable_observations():
     config.enable_observations = original_value
 
 
-@pytest.mark.asyncio
-async def test_link_expansion_observation_graph_retrieval(memory, request_context):
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def shared_link_bank(module_memory, enable_observations):
+    """
+    Ingest LINK_CORPUS once and yield its bank_id.
+
+    Both tests only run recalls against the corpus, so sharing one bank halves the
+    embedding, entity-linking and consolidation LLM work of this module.
+    """
+    request_context = RequestContext()
+    bank_id = f"test_link_expansion_{uuid.uuid4().hex}"
+    await module_memory.retain_batch_async(bank_id=bank_id, contents=LINK_CORPUS, request_context=request_context)
+    # module_memory uses SyncTaskBackend, so consolidation has already run inline in
+    # retain_batch_async; this is a no-op that only guards against an async backend
+    await module_memory.wait_for_background_tasks()
+    yield bank_id
+    await module_memory.delete_bank(bank_id, request_context=request_context)
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_link_expansion_observation_graph_retrieval(module_memory, shared_link_bank, request_context):
     """
     Test that observations can find other observations via shared entities.
 
@@ -41,163 +89,84 @@ async def test_link_expansion_observation_graph_retrieval(memory, request_contex
     - Observations only share entities with world facts (cross-type), not with other observations
     - So filtering to fact_type='observation' returns 0 results
     """
-    bank_id = f"test_link_expansion_obs_{datetime.now(timezone.utc).timestamp()}"
-
-    try:
-        # Store world facts with shared entities using retain_batch_async
-        # We need enough facts that semantic search won't return all of them as seeds
-        # Key: "Alice" query should find Alice's observation but NOT Bob's via semantic search
-        # Then graph retrieval should find Bob via shared "Python" entity
-        await memory.retain_batch_async(
-            bank_id=bank_id,
-            contents=[
-                # Python developers - should be connected via "Python" entity
-                {
-                    "content": "Alice works with Python at TechCorp building REST APIs",
-                    "context": "employee info",
-                    "entities": [{"text": "Python"}, {"text": "Alice"}, {"text": "TechCorp"}],
-                },
-                {
-                    "content": "Bob uses Python at DataSoft for machine learning models",
-                    "context": "employee info",
-                    "entities": [{"text": "Python"}, {"text": "Bob"}, {"text": "DataSoft"}],
-                },
-                # Many unrelated facts to dilute semantic search and ensure
-                # "Alice" query only finds Alice-related content as seeds
-                {
-                    "content": "The weather in San Francisco is often foggy and cool",
-                    "context": "weather info",
-                    "entities": [{"text": "San Francisco"}],
-                },
-                {
-                    "content": "Tokyo is the capital city of Japan with many trains",
-                    "context": "geography info",
-                    "entities": [{"text": "Tokyo"}, {"text": "Japan"}],
-                },
-                {
-                    "content": "The Great Wall of China is a historic fortification",
-                    "context": "history info",
-                    "entities": [{"text": "Great Wall"}, {"text": "China"}],
-                },
-                {
-                    "content": "Coffee beans are grown in tropical regions worldwide",
-                    "context": "food info",
-                    "entities": [{"text": "Coffee"}],
-                },
-                {
-                    "content": "Electric vehicles are becoming more popular globally",
-                    "context": "technology info",
-                    "entities": [{"text": "Electric vehicles"}],
-                },
-                {
-                    "content": "The Amazon rainforest contains diverse wildlife species",
-                    "context": "nature info",
-                    "entities": [{"text": "Amazon"}, {"text": "Rainforest"}],
-                },
-                {
-                    "content": "Basketball is a popular sport in the United States",
-                    "context": "sports info",
-                    "entities": [{"text": "Basketball"}, {"text": "United States"}],
-                },
-                {
-                    "content": "Mozart composed many famous classical music pieces",
-                    "context": "music info",
-                    "entities": [{"text": "Mozart"}, {"text": "Classical music"}],
-                },
-            ],
+    # The three recalls are independent, so run them concurrently
+    obs_result, result, world_result = await asyncio.gather(
+        module_memory.recall_async(
+            bank_id=shared_link_bank,
+            query="Python developer",
+            fact_type=["observation"],
+            # Only checks that consolidation produced observations; no graph/rerank depth needed
+            budget=Budget.LOW,
+            max_tokens=2048,
             request_context=request_context,
-        )
-
-        # Consolidation runs automatically after retain - wait for it to complete
-        # by querying for observations (consolidation creates them)
-        import asyncio
-        from hindsight_api.engine.memory_engine import Budget
-
-        # Wait for consolidation to complete with retry logic
-        # Consolidation runs as a background task and may take longer in CI
-        obs_result = None
-        for _ in range(30):  # Try up to 30 times (30 seconds max)
-            await asyncio.sleep(1)  # Wait 1 second between attempts
-            obs_result = await memory.recall_async(
-                bank_id=bank_id,
-                query="Python developer",
-                fact_type=["observation"],
-                budget=Budget.MID,
-                max_tokens=2048,
-                request_context=request_context,
-            )
-            if obs_result.results and len(obs_result.results) >= 1:
-                break
-
-        assert obs_result is not None and obs_result.results is not None, "Should have observations after consolidation"
-        # We should have observations from consolidation
-        assert len(obs_result.results) >= 1, f"Should have at least 1 observation about Python, got {len(obs_result.results)}"
-
-        # Now test graph retrieval specifically
+        ),
         # Query for Alice - should find Bob via shared "Python" entity
-        result = await memory.recall_async(
-            bank_id=bank_id,
+        module_memory.recall_async(
+            bank_id=shared_link_bank,
             query="Alice",
             fact_type=["observation"],
             budget=Budget.MID,
             max_tokens=2048,
             enable_trace=True,
             request_context=request_context,
-        )
-
-        # Verify graph retrieval is working by checking the internal debug logs
-        # The graph retrieval finds observations via entity links, but may not return
-        # NEW results if semantic search already found all connected observations.
-        # This is correct behavior - we verify the entity traversal path works.
-
-        # Check the trace for graph results
-        assert result.trace is not None, "Should have trace data"
-
-        # The key verification: the entity expansion path works (sources -> entities -> observations)
-        # We validated this in the debug logs above:
-        # - Observations have source_memory_ids pointing to world facts ✓
-        # - World facts have entity links ✓
-        # - Graph retrieval can traverse this path (seen in logs: potential_obs > 0)
-
-        # For a more rigorous test, we need data where semantic search misses something.
-        # Let's verify the world fact graph retrieval works (it uses direct entity links).
-        world_result = await memory.recall_async(
-            bank_id=bank_id,
+        ),
+        # Same query over world facts, which use direct entity links
+        module_memory.recall_async(
+            bank_id=shared_link_bank,
             query="Alice",
             fact_type=["world"],
             budget=Budget.MID,
             max_tokens=2048,
             enable_trace=True,
             request_context=request_context,
-        )
-
-        assert world_result.trace is not None, "Should have trace data for world facts"
-        world_retrieval_results = world_result.trace.get("retrieval_results", [])
-        world_graph_results = [
-            r for r in world_retrieval_results if r.get("method_name") == "graph"
-        ]
-
-        if world_graph_results:
-            world_graph_result = [r for r in world_graph_results if r.get("fact_type") == "world"][0]
-            world_graph_results_list = world_graph_result.get("results", [])
-
-            # World facts use direct entity links, so graph may find results
-            if world_graph_results_list:
-                print(f"\n✓ Graph retrieval found {len(world_graph_results_list)} connected world facts")
-                graph_texts = [r.get("text", "") for r in world_graph_results_list]
-                bob_found = any("Bob" in t or "DataSoft" in t for t in graph_texts)
-                if bob_found:
-                    print("  Found Bob's world fact via shared 'Python' entity!")
-
-        print("\n✓ Link expansion observation test passed!")
-        print("  Entity traversal path verified (observations -> sources -> entities -> connected sources -> observations)")
-
-    finally:
-        await memory.delete_bank(bank_id, request_context=request_context)
-
-
-@pytest.mark.asyncio
-async def test_link_expansion_world_fact_graph_retrieval(memory, request_context):
+        ),
+    )
+
+    assert obs_result is not None and obs_result.results is not None, "Should have observations after consolidation"
+    # We should have observations from consolidation
+    assert len(obs_result.results) >= 1, f"Should have at least 1 observation about Python, got {len(obs_result.results)}"
+
+    # Now test graph retrieval specifically
+    # Verify graph retrieval is working by checking the internal debug logs
+    # The graph retrieval finds observations via entity links, but may not return
+    # NEW results if semantic search already found all connected observations.
+    # This is correct behavior - we verify the entity traversal path works.
+
+    # Check the trace for graph results
+    assert result.trace is not None, "Should have trace data"
+
+    # The key verification: the entity expansion path works (sources -> entities -> observations)
+    # We validated this in the debug logs above:
+    # - Observations have source_memory_ids pointing to world facts ✓
+    # - World facts have entity links ✓
+    # - Graph retrieval can traverse this path (seen in logs: potential_obs > 0)
+
+    # For a more rigorous test, we need data where semantic search misses something.
+    # Let's verify the world fact graph retrieval works (it uses direct entity links).
+    assert world_result.trace is not None, "Should have trace data for world facts"
+    world_retrieval_results = world_result.trace.get("retrieval_results", [])
+    world_graph_results = [
+        r for r in world_retrieval_results if r.get("method_name") == "graph"
+    ]
+
+    if world_graph_results:
+        world_graph_result = [r for r in world_graph_results if r.get("fact_type") == "world"][0]
+        world_graph_results_list = world_graph_result.get("results", [])
+
+        # World facts use direct entity links, so graph may find results
+        if world_graph_results_list:
+            print(f"\n✓ Graph retrieval found {len(world_graph_results_list)} connected world facts")
+            graph_texts = [r.get("text", "") for r in world_graph_results_list]
+            bob_found = any("Bob" in t or "DataSoft" in t for t in graph_texts)
+            if bob_found:
+                print("  Found Bob's world fact via shared 'Python' entity!")
+
+    print("\n✓ Link expansion observation test passed!")
+    print("  Entity traversal path verified (observations -> sources -> entities -> connected sources -> observations)")
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_link_expansion_world_fact_graph_retrieval(module_memory, shared_link_bank, request_context):
     """
     Test that world facts can find other world facts via shared entities.
 
@@ -205,75 +174,37 @@ async def test_link_expansion_world_fact_graph_retrieval(memory, request_context
     Note: When semantic search finds all world facts as seeds, graph retrieval
     won't return NEW results (this is correct - it shouldn't duplicate results).
     """
-    bank_id = f"test_link_expansion_world_{datetime.now(timezone.utc).timestamp()}"
-
-    try:
-        # Store world facts with shared entities
-        await memory.retain_batch_async(
-            bank_id=bank_id,
-            contents=[
-                # Python developers - should be connected via "Python" entity
-                {
-                    "content": "Alice works with Python at TechCorp building REST APIs",
-                    "context": "employee info",
-                    "entities": [{"text": "Python"}, {"text": "Alice"}, {"text": "TechCorp"}],
-                },
-                {
-                    "content": "Bob uses Python at DataSoft for machine learning models",
-                    "context": "employee info",
-                    "entities": [{"text": "Python"}, {"text": "Bob"}, {"text": "DataSoft"}],
-                },
-                # Unrelated facts
-                {
-                    "content": "The weather in San Francisco is often foggy",
-                    "context": "weather info",
-                    "entities": [{"text": "San Francisco"}],
-                },
-                {
-                    "content": "Coffee beans are grown in tropical regions",
-                    "context": "food info",
-                    "entities": [{"text": "Coffee"}],
-                },
-            ],
-            request_context=request_context,
-        )
-
-        from hindsight_api.engine.memory_engine import Budget
-
-        # Query for Alice. Don't filter by fact_type — LLM classification is
-        # non-deterministic and may classify "Alice works with Python" as either
-        # world or experience, causing retrieval to return 0 results.
-        result = await memory.recall_async(
-            bank_id=bank_id,
-            query="Alice",
-            budget=Budget.MID,
-            max_tokens=2048,
-            enable_trace=True,
-            request_context=request_context,
-        )
-
-        assert result.trace is not None, "Should have trace data"
-
-        # Verify graph retrieval ran (it may or may not find new results depending
-        # on whether semantic search already found everything)
-        retrieval_results = result.trace.get("retrieval_results", [])
-        graph_results = [
-            r for r in retrieval_results if r.get("method_name") == "graph"
-        ]
-        assert len(graph_results) > 0, "Should have graph retrieval results in trace"
-
-        # The important thing is that recall works and returns relevant results
-        assert result.results is not None and len(result.results) > 0, (
-            "Should return results for 'Alice' query"
-        )
-
-        # Alice's result should be at or near the top
-        result_texts = [r.text for r in result.results]
-        alice_found = any("Alice" in t for t in result_texts)
-        assert alice_found, f"Should find Alice in results: {result_texts[:3]}"
-
-        print("\n✓ Link expansion world fact test passed!")
-        print(f"  Recall returned {len(result.results)} results for 'Alice' query")
-
-    finally:
-        await memory.delete_bank(bank_id, request_context=request_context)
+    # Query for Alice. Don't filter by fact_type — LLM classification is
+    # non-deterministic and may classify "Alice works with Python" as either
+    # world or experience, causing retrieval to return 0 results.
+    result = await module_memory.recall_async(
+        bank_id=shared_link_bank,
+        query="Alice",
+        budget=Budget.MID,
+        max_tokens=2048,
+        enable_trace=True,
+        request_context=request_context,
+    )
+
+    assert result.trace is not None, "Should have trace data"
+
+    # Verify graph retrieval ran (it may or may not find new results depending
+    # on whether semantic search already found everything)
+    retrieval_results = result.trace.get("retrieval_results", [])
+    graph_results = [
+        r for r in retrieval_results if r.get("method_name") == "graph"
+    ]
+    assert len(graph_results) > 0, "Should have graph retrieval results in trace"
+
+    # The important thing is that recall works and returns relevant results
+    assert result.results is not None and len(result.results) > 0, (
+        "Should return results for 'Alice' query"
+    )
+
+    # Alice's result should be at or near the top
+    result_texts = [r.text for r in result.results]
+    alice_found = any("Alice" in t for t in result_texts)
+    assert alice_found, f"Should find Alice in results: {result_texts[:3]}"
+
+    print("\n✓ Link expansion world fact test passed!")
+    print(f"  Recall returned {len(result.results)} results for 'Alice' query")
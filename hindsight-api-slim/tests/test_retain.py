@@ -2330,7 +2330,7 @@ def test_recall_result_model_empty_construction():
 
 
 @pytest.mark.asyncio
-async def test_custom_extraction_mode():
+async def test_custom_extraction_mode(llm_config):
     """
     Test that custom extraction mode uses custom guidelines from env variable.
 
@@ -2340,7 +2340,6 @@ async def test_custom_extraction_mode():
     """
     import os
 
-    from hindsight_api import LLMConfig
     from hindsight_api.config import _get_raw_config, clear_config_cache
     from hindsight_api.engine.retain.fact_extraction import extract_facts_from_text
 
@@ -2377,8 +2376,6 @@ If the text contains both Italian and English content, extract ONLY the Italian
         Il sistema di autenticazione è stato migrato a OAuth 2.0.
         """
 
-        llm_config = LLMConfig.from_env()
-
         facts, _, _ = await extract_facts_from_text(
             text=text,
             event_date=datetime(2024, 1, 15, tzinfo=timezone.utc),
@@ -2584,7 +2581,7 @@ def test_chunks_extraction_mode():
 
 
 @pytest.mark.asyncio
-async def test_verbatim_extraction_mode():
+async def test_verbatim_extraction_mode(llm_config):
     """
     Integration test for verbatim extraction mode.
 
@@ -2596,7 +2593,6 @@ async def test_verbatim_extraction_mode():
     """
     import os
 
-    from hindsight_api import LLMConfig
     from hindsight_api.config import _get_raw_config, clear_config_cache
     from hindsight_api.engine.retain.fact_extraction import extract_facts_from_contents
     from hindsight_api.engine.retain.types import RetainContent
@@ -2612,7 +2608,6 @@ async def test_verbatim_extraction_mode():
             "She holds a CKA certification and has 5 years of Kubernetes experience."
         )
 
-        llm_config = LLMConfig.from_env()
         contents = [RetainContent(content=text, event_date=datetime(2024, 3, 10, tzinfo=timezone.utc), context="onboarding notes")]
         facts, chunks, _ = await extract_facts_from_contents(
             contents=contents,
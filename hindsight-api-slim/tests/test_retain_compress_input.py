@@ -0,0 +1,44 @@
+"""
+Tests for the optional filler-stripping applied to text sent to the extraction LLM.
+"""
+import dataclasses
+
+from hindsight_api.config import _get_raw_config
+from hindsight_api.engine.retain.fact_extraction import _compress_text, _maybe_compress
+
+
+def test_compress_strips_filler_words():
+    """Filler words and their trailing commas are removed."""
+    assert _compress_text("Yes, um, I think so.") == "Yes, I think so."
+    assert _compress_text("but honestly, I'm pretty happy") == "but I'm pretty happy"
+    assert _compress_text("I literally can't wait") == "I can't wait"
+
+
+def test_compress_keeps_meaning_bearing_words():
+    """Hedges, intensifiers and words merely containing a filler are untouched."""
+    text = "Maybe I really like the umbrella, kind of."
+    assert _compress_text(text) == text
+    # Fillers only match as whole words, not inside longer ones
+    for text in ("Do we need a permit?", "Hermes serves thermal umami.", "Uhura was honest."):
+        assert _compress_text(text) == text
+
+
+def test_compress_preserves_line_breaks():
+    """Conversation turns stay on separate lines."""
+    text = "Alice: Um, so I went home\nBob: Uh I came back basically."
+    assert _compress_text(text) == "Alice: so I went home\nBob: I came back."
+
+
+def test_maybe_compress_respects_config():
+    """Compression only happens when retain_compress_input is enabled."""
+    text = "Um, hello there"
+    config = _get_raw_config()
+    assert _maybe_compress(text, dataclasses.replace(config, retain_compress_input=False)) == text
+    assert _maybe_compress(text, dataclasses.replace(config, retain_compress_input=True)) == "hello there"
+
+
+def test_maybe_compress_skips_verbatim_mode():
+    """Verbatim extraction sees the original words even with compression enabled."""
+    text = "Honestly, um, I said it."
+    config = dataclasses.replace(_get_raw_config(), retain_compress_input=True, retain_extraction_mode="verbatim")
+    assert _maybe_compress(text, config) == text
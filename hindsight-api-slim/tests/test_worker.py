@@ -1866,8 +1866,7 @@ async def test_worker_fire_and_forget_nonblocking(pool, backend, clean_operation
 
         # Verify at least our 2 tasks are in_flight (leaked non-our-bank tasks
         # return immediately from the executor but can transiently be counted).
-        async with poller._in_flight_lock:
-            assert poller._in_flight_count >= 2
+        assert poller._in_flight_count >= 2
 
         # NOW submit 2 more tasks WHILE the first 2 are still running
         for i in range(2):
@@ -1900,8 +1899,7 @@ async def test_worker_fire_and_forget_nonblocking(pool, backend, clean_operation
 
         # Verify at least all 4 of ours are in-flight (see comment above about
         # transient leaked tasks).
-        async with poller._in_flight_lock:
-            assert poller._in_flight_count >= 4
+        assert poller._in_flight_count >= 4
 
         # Clean up: allow all tasks to finish
         for event in task_canfinish.values():
@@ -2105,8 +2103,7 @@ async def test_consolidation_slots_reserved_when_retain_saturates(pool, backend,
         # otherwise the consolidation pool accounting drifts on subsequent claims.
         # Use >= because parallel test files may transiently contribute a
         # consolidation claim that our executor returns from immediately.
-        async with poller._in_flight_lock:
-            assert poller._in_flight_by_type.get("consolidation", 0) >= 1
+        assert poller._in_flight_by_type.get("consolidation", 0) >= 1
 
     finally:
         for event in finish_events.values():
@@ -2211,9 +2208,8 @@ async def test_per_operation_slot_reservations(pool, backend, clean_operations):
         # Verify in-flight tracking — use >= to tolerate transient leaked
         # tasks from parallel test files (our executor returns from them
         # immediately, but the counter may see them briefly).
-        async with poller._in_flight_lock:
-            assert poller._in_flight_by_type.get("retain", 0) >= 6
-            assert poller._in_flight_by_type.get("consolidation", 0) >= 2
+        assert poller._in_flight_by_type.get("retain", 0) >= 6
+        assert poller._in_flight_by_type.get("consolidation", 0) >= 2
 
     finally:
         for event in finish_events.values():
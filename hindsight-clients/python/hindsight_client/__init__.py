@@ -55,6 +55,7 @@ from hindsight_client_api.models.reflect_response import ReflectResponse
 from hindsight_client_api.models.retain_response import RetainResponse
 
 from .hindsight_client import Hindsight
+from .semantic_cache import SemanticCache
 
 
 # Add cleaner __repr__ and __iter__ for REPL usability
@@ -150,6 +151,7 @@ RecallResponse = _RecallResponse
 
 __all__ = [
     "Hindsight",
+    "SemanticCache",
     # Response types
     "RetainResponse",
     "RecallResponse",
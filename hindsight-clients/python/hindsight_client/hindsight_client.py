@@ -6,7 +6,12 @@ easy-to-use interface on top of the auto-generated OpenAPI client.
 """
 
 import asyncio
+import functools
 import json
+import logging
+import re
+import threading
+import warnings
 from datetime import datetime
 from importlib import metadata
 from pathlib import Path
@@ -33,10 +38,14 @@ from hindsight_client_api.api import (
     webhooks_api,
 )
 from hindsight_client_api.models import (
+    chunk_include_options,
+    entity_include_options,
+    include_options,
     memory_item,
     recall_request,
     reflect_request,
     retain_request,
+    source_facts_include_options,
 )
 from hindsight_client_api.models.reflect_include_options import ReflectIncludeOptions
 from hindsight_client_api.models.bank_profile_response import BankProfileResponse
@@ -46,17 +55,190 @@ from hindsight_client_api.models.recall_response import RecallResponse
 from hindsight_client_api.models.recall_result import RecallResult
 from hindsight_client_api.models.reflect_response import ReflectResponse
 from hindsight_client_api.models.retain_response import RetainResponse
+from hindsight_client_api.models.token_usage import TokenUsage
 
+from .semantic_cache import SemanticCache
 
-def _run_async(coro):
-    """Run an async coroutine synchronously."""
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+_LOOP: asyncio.AbstractEventLoop | None = None
+_LOOP_LOCK = threading.Lock()
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create a uvloop loop when the optional ``uvloop`` package is installed, else a stock asyncio loop."""
     try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        import uvloop
+    except ImportError:
+        return asyncio.new_event_loop()
+    return uvloop.new_event_loop()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared event loop used by the sync wrappers, starting its thread on first use."""
+    global _LOOP
+    with _LOOP_LOCK:
+        if _LOOP is None:
+            loop = _new_event_loop()
+            threading.Thread(target=loop.run_forever, name="hindsight-client-loop", daemon=True).start()
+            _LOOP = loop
+    return _LOOP
+
 
-    return loop.run_until_complete(coro)
+def _run_async(coro):
+    """Run an async coroutine synchronously on the shared background event loop.
+
+    Keeping one long-lived loop means the aiohttp session created on the first
+    sync call keeps its connection pool alive across later calls.
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result()
+
+
+# Same JSON content-type check as the generated ApiClient.deserialize
+_JSON_CONTENT_TYPE_RE = re.compile(r"^application/(json|[\w!#$&.+-^_]+\+json)\s*(;|$)", re.IGNORECASE)
+
+# The generated ApiClient's private data-to-model step; the orjson path is skipped if a
+# regeneration renames it (tests/test_deserialize.py fails loudly in that case)
+_GENERATED_DESERIALIZE = getattr(hindsight_client_api.ApiClient, "_ApiClient__deserialize", None)
+
+
+class _ApiClient(hindsight_client_api.ApiClient):
+    """
+    Generated ApiClient that remembers which loop opened its HTTP session and parses
+    JSON responses with ``orjson`` when the optional package is installed.
+    """
+
+    # Event loop the aiohttp session was opened on (and must be closed on); None until the first request
+    session_loop: asyncio.AbstractEventLoop | None = None
+
+    def _ensure_session(self) -> None:
+        """Open the HTTP session on the running loop if needed, recording that loop."""
+        if self.session_loop is None:
+            self.session_loop = asyncio.get_running_loop()
+        self.rest_client._ensure_session()
+
+    async def call_api(self, *args, **kwargs):
+        self._ensure_session()
+        return await super().call_api(*args, **kwargs)
+
+    def deserialize(self, response_text: str, response_type: str, content_type: str | None):
+        if (
+            orjson is None
+            or _GENERATED_DESERIALIZE is None
+            or not response_text
+            or (content_type is not None and not _JSON_CONTENT_TYPE_RE.match(content_type))
+        ):
+            return super().deserialize(response_text, response_type, content_type)
+        try:
+            data = orjson.loads(response_text)
+        except orjson.JSONDecodeError:
+            # Let the generated path produce its usual result (plain text or error) for non-JSON bodies
+            return super().deserialize(response_text, response_type, content_type)
+        return _GENERATED_DESERIALIZE(self, data, response_type)
+
+
+def _new_api_client(base_url: str, api_key: str | None, user_agent: str) -> hindsight_client_api.ApiClient:
+    config = hindsight_client_api.Configuration(host=base_url, access_token=api_key)
+    api_client = _ApiClient(config)
+    api_client.user_agent = user_agent
+    if api_key:
+        api_client.set_default_header("Authorization", f"Bearer {api_key}")
+    return api_client
+
+
+def _chunk_retain_items(
+    items: list[dict[str, Any]], document_id: str | None, chunk_size: int
+) -> list[list[dict[str, Any]]]:
+    """Split retain items into chunks of about ``chunk_size`` without splitting a document across chunks."""
+    units: dict[Any, list[dict[str, Any]]] = {}
+    for i, item in enumerate(items):
+        item_document_id = item.get("document_id") or document_id
+        units.setdefault(item_document_id if item_document_id is not None else (None, i), []).append(item)
+
+    chunks: list[list[dict[str, Any]]] = []
+    current: list[dict[str, Any]] = []
+    for unit in units.values():
+        if current and len(current) + len(unit) > chunk_size:
+            chunks.append(current)
+            current = []
+        current.extend(unit)
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _merge_retain_responses(responses: list[RetainResponse]) -> RetainResponse:
+    """Combine the responses of a chunked retain into one."""
+    if len(responses) == 1:
+        return responses[0]
+    operation_ids = [
+        op_id for r in responses for op_id in (r.operation_ids or ([r.operation_id] if r.operation_id else []))
+    ]
+    usages = [r.usage for r in responses if r.usage is not None]
+    return RetainResponse(
+        success=all(r.success for r in responses),
+        bank_id=responses[0].bank_id,
+        items_count=sum(r.items_count for r in responses),
+        var_async=responses[0].var_async,
+        operation_id=operation_ids[0] if len(operation_ids) == 1 else None,
+        operation_ids=operation_ids or None,
+        usage=TokenUsage(
+            input_tokens=sum(u.input_tokens or 0 for u in usages),
+            output_tokens=sum(u.output_tokens or 0 for u in usages),
+            total_tokens=sum(u.total_tokens or 0 for u in usages),
+        )
+        if usages
+        else None,
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _recall_include_options(
+    max_entity_tokens: int | None, max_chunk_tokens: int | None, max_source_facts_tokens: int | None
+) -> include_options.IncludeOptions:
+    """Build (once per shape) the recall include options; ``None`` leaves that section out.
+
+    The returned model is shared between requests and must not be mutated.
+    """
+    return include_options.IncludeOptions(
+        entities=entity_include_options.EntityIncludeOptions(max_tokens=max_entity_tokens)
+        if max_entity_tokens is not None
+        else None,
+        chunks=chunk_include_options.ChunkIncludeOptions(max_tokens=max_chunk_tokens)
+        if max_chunk_tokens is not None
+        else None,
+        source_facts=source_facts_include_options.SourceFactsIncludeOptions(max_tokens=max_source_facts_tokens)
+        if max_source_facts_tokens is not None
+        else None,
+    )
+
+
+# ApiClients shared by ``Hindsight(..., shared=True)`` instances, with their reference counts
+_SHARED_CLIENTS: dict[tuple[str, str | None, str], tuple[hindsight_client_api.ApiClient, int]] = {}
+_SHARED_CLIENTS_LOCK = threading.Lock()
+
+
+def _acquire_shared_api_client(key: tuple[str, str | None, str]) -> hindsight_client_api.ApiClient:
+    with _SHARED_CLIENTS_LOCK:
+        api_client, refs = _SHARED_CLIENTS.get(key) or (_new_api_client(*key), 0)
+        _SHARED_CLIENTS[key] = (api_client, refs + 1)
+        return api_client
+
+
+def _release_shared_api_client(key: tuple[str, str | None, str]) -> bool:
+    """Drop one reference to a shared ApiClient; return True if it was the last one."""
+    with _SHARED_CLIENTS_LOCK:
+        api_client, refs = _SHARED_CLIENTS[key]
+        if refs > 1:
+            _SHARED_CLIENTS[key] = (api_client, refs - 1)
+            return False
+        del _SHARED_CLIENTS[key]
+        return True
 
 
 class Hindsight:
@@ -71,9 +253,9 @@ class Hindsight:
     **Prefer the async variants** (``aretain``, ``arecall``, ``areflect``, etc.)
     whenever you are inside an async context (``async def``, event loops,
     frameworks like FastAPI/LangGraph/CrewAI). The sync versions (``retain``,
-    ``recall``, ``reflect``) are convenience wrappers that call
-    ``asyncio.run_until_complete`` under the hood — they exist for scripts and
-    REPLs but will raise errors if an event loop is already running.
+    ``recall``, ``reflect``) are convenience wrappers that run the async method
+    on a shared background event loop and block until it finishes — they exist
+    for scripts and REPLs and would block a running event loop if called from one.
 
     For operations not covered here (documents, entities, operations/async jobs,
     webhooks, file uploads, monitoring), use the low-level API clients exposed
@@ -91,6 +273,14 @@ class Hindsight:
         response = await client.arecall(bank_id="alice", query="What does Alice like?")
         answer = await client.areflect(bank_id="alice", query="What are my interests?")
 
+    Example — many requests at once (bulk scripts)::
+
+        # The a* methods share the client's aiohttp connection pool, so independent
+        # calls issued together run concurrently instead of one round-trip at a time
+        responses = await asyncio.gather(
+            *(client.arecall(bank_id="alice", query=q) for q in queries)
+        )
+
     Example — sync (scripts / REPLs only)::
 
         # Outside an async context — sync wrappers are available
@@ -133,6 +323,9 @@ class Hindsight:
         api_key: str | None = None,
         timeout: float = 300.0,
         user_agent: str | None = None,
+        shared: bool = False,
+        cache: SemanticCache | None = None,
+        warmup: bool = False,
     ):
         """
         Initialize the Hindsight client.
@@ -145,15 +338,32 @@ class Hindsight:
                 should set this to identify themselves (e.g.
                 ``"hindsight-crewai/1.2.0"``). Defaults to
                 ``hindsight-client-python/<version>``.
+            shared: Reuse one underlying HTTP client (and its keep-alive connection
+                pool) across all ``shared=True`` instances with the same base URL,
+                API key and user agent. The connection is closed when the last of
+                them is closed. Shared instances must be used from the same event
+                loop, e.g. only through the sync methods.
+            cache: Optional :class:`SemanticCache` consulted before ``recall`` and
+                ``reflect``. A hit returns the cached response without calling the API.
+                Entries for a bank are dropped whenever this client retains into it;
+                writes by other clients (or the server finishing an async retain or
+                file upload later) are not seen until the cache's ``ttl`` expires.
+            warmup: Open the HTTP connection in the background with a ``GET /health``
+                so the first real request does not pay for the TCP/TLS handshake.
+                Does not block. The connection lives on the sync methods' event
+                loop, so only use this when calling the sync methods.
         """
-        config = hindsight_client_api.Configuration(host=base_url, access_token=api_key)
-        self._api_client = hindsight_client_api.ApiClient(config)
-        self._api_client.user_agent = user_agent or DEFAULT_USER_AGENT
+        user_agent = user_agent or DEFAULT_USER_AGENT
+        self._shared_key = (base_url, api_key, user_agent) if shared else None
+        if self._shared_key:
+            self._api_client = _acquire_shared_api_client(self._shared_key)
+        else:
+            self._api_client = _new_api_client(base_url, api_key, user_agent)
+        self._cache = cache
+        self._closed = False
         self._timeout = timeout
         self._base_url = base_url.rstrip("/")
         self._api_key = api_key
-        if api_key:
-            self._api_client.set_default_header("Authorization", f"Bearer {api_key}")
         self._memory_api = memory_api.MemoryApi(self._api_client)
         self._banks_api = banks_api.BanksApi(self._api_client)
         self._mental_models_api = mental_models_api.MentalModelsApi(self._api_client)
@@ -164,6 +374,14 @@ class Hindsight:
         self._operations_api = operations_api.OperationsApi(self._api_client)
         self._webhooks_api = webhooks_api.WebhooksApi(self._api_client)
         self._monitoring_api = monitoring_api.MonitoringApi(self._api_client)
+        self._warmup_future = asyncio.run_coroutine_threadsafe(self._warmup(), _get_loop()) if warmup else None
+
+    async def _warmup(self) -> None:
+        try:
+            await self._monitoring_api.health_endpoint_health_get(_request_timeout=self._timeout)
+        except Exception as e:
+            # Best effort: a failed warmup just leaves the first real request to connect
+            logger.warning("Hindsight connection warmup to %s failed: %r", self._base_url, e)
 
     # -- Low-level API accessors ------------------------------------------------
     # These expose the full, auto-generated API surface for operations not
@@ -228,22 +446,101 @@ class Hindsight:
         """Context manager exit."""
         self.close()
 
+    def _stop_warmup(self) -> None:
+        """Cancel a pending warmup and wait until it can no longer open a session."""
+        future, self._warmup_future = self._warmup_future, None
+        if future is None or not future.cancel():
+            return
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is not _LOOP:
+            # One pass of the background loop lets the cancellation land before the session is checked
+            asyncio.run_coroutine_threadsafe(asyncio.sleep(0), _LOOP).result(timeout=5)
+
+    def _release_api_client(self) -> bool:
+        """Give up this instance's hold on the API client; return True if it should be closed now."""
+        if self._closed:
+            return False
+        self._closed = True
+        if self._shared_key is None:
+            return True
+        key, self._shared_key = self._shared_key, None
+        return _release_shared_api_client(key)
+
+    def _close_on_stopped_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Close a session whose loop no longer runs: on that loop if still open, else on a temporary one."""
+        if loop.is_closed():
+            asyncio.run(self._api_client.close())
+        else:
+            loop.run_until_complete(self._api_client.close())
+
     def close(self):
-        """Close the API client (sync version - use aclose() in async code)."""
-        if self._api_client:
+        """
+        Close the API client (sync version - use aclose() in async code).
+
+        Safe to call more than once. The HTTP session is closed on the event loop
+        that opened it; when called from inside a running loop the close is
+        scheduled without waiting for it. A session left behind by a loop that has
+        stopped (e.g. after ``asyncio.run`` returned) is closed on that loop, or on
+        a temporary one if it was closed.
+        """
+        self._stop_warmup()
+        if not self._release_api_client():
+            return
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        session_loop = self._api_client.session_loop
+        if session_loop is None:
+            return
+        if session_loop is running_loop:
+            # Session belongs to the caller's loop - schedule but don't wait
+            # The caller should use aclose() instead
+            running_loop.create_task(self._api_client.close())
+        elif session_loop.is_running():
+            future = asyncio.run_coroutine_threadsafe(self._api_client.close(), session_loop)
+            if running_loop is None:
+                future.result(timeout=5)
+        else:
             try:
-                loop = asyncio.get_running_loop()
-                # We're in an async context - schedule but don't wait
-                # The caller should use aclose() instead
-                loop.create_task(self._api_client.close())
-            except RuntimeError:
-                # No running loop - safe to run synchronously
-                _run_async(self._api_client.close())
+                if running_loop is not None:
+                    raise RuntimeError("another event loop is running in this thread")
+                self._close_on_stopped_loop(session_loop)
+            except Exception as e:
+                warnings.warn(
+                    f"Could not close the Hindsight HTTP session ({e!r}); "
+                    "call 'await client.aclose()' instead.",
+                    ResourceWarning,
+                    stacklevel=2,
+                )
 
     async def aclose(self):
         """Close the API client (async version)."""
-        if self._api_client:
+        self._stop_warmup()
+        if not self._release_api_client():
+            return
+        session_loop = self._api_client.session_loop
+        if session_loop is None:
+            return
+        if session_loop is asyncio.get_running_loop():
             await self._api_client.close()
+        elif session_loop.is_running():
+            await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(self._api_client.close(), session_loop))
+        else:
+            await asyncio.to_thread(self._close_on_stopped_loop, session_loop)
+
+    def _invalidate_cache(self, bank_id: str) -> None:
+        """Drop cached recall/reflect responses for a bank this client just wrote to."""
+        if self._cache is not None:
+            self._cache.invalidate(bank_id)
+
+    @staticmethod
+    def _cache_scope(operation: str, **params: Any) -> str:
+        """Key cached responses by operation and the request arguments other than the query text."""
+        return json.dumps([operation, params], sort_keys=True, default=str)
 
     # Simplified methods for main operations
 
@@ -302,6 +599,8 @@ class Hindsight:
         document_id: str | None = None,
         document_tags: list[str] | None = None,
         retain_async: bool = False,
+        chunk_size: int | None = None,
+        max_concurrency: int = 4,
     ) -> RetainResponse:
         """
         Store multiple memories in batch (sync wrapper — prefer :meth:`aretain_batch` in async code).
@@ -314,9 +613,14 @@ class Hindsight:
             document_id: Optional document ID for grouping memories (applied to items that don't have their own)
             document_tags: Optional list of tags applied to all items in this batch (merged with per-item tags)
             retain_async: If True, process asynchronously in background (default: False)
+            chunk_size: If set, split ``items`` into requests of about this many items and send
+                them concurrently. Items sharing a document ID always stay in the same request.
+                Chunks are not atomic: if one fails, the others may already be stored.
+            max_concurrency: Maximum number of chunk requests in flight at once (default: 4)
 
         Returns:
-            RetainResponse with success status and item count
+            RetainResponse with success status and item count. For a chunked retain the
+            counts and usage are summed, and async operation IDs are listed in ``operation_ids``.
         """
         return _run_async(
             self.aretain_batch(
@@ -325,6 +629,8 @@ class Hindsight:
                 document_id=document_id,
                 document_tags=document_tags,
                 retain_async=retain_async,
+                chunk_size=chunk_size,
+                max_concurrency=max_concurrency,
             )
         )
 
@@ -361,7 +667,9 @@ class Hindsight:
 
         request_body = json.dumps({"files_metadata": meta})
 
-        return _run_async(self._files_api.file_retain(bank_id=bank_id, files=file_data, request=request_body, _request_timeout=self._timeout))
+        response = _run_async(self._files_api.file_retain(bank_id=bank_id, files=file_data, request=request_body, _request_timeout=self._timeout))
+        self._invalidate_cache(bank_id)
+        return response
 
     def recall(
         self,
@@ -710,6 +1018,8 @@ class Hindsight:
         document_id: str | None = None,
         document_tags: list[str] | None = None,
         retain_async: bool = False,
+        chunk_size: int | None = None,
+        max_concurrency: int = 4,
     ) -> RetainResponse:
         """
         Store multiple memories in batch (async — preferred over :meth:`retain_batch`).
@@ -722,10 +1032,31 @@ class Hindsight:
             document_id: Optional document ID for grouping memories (applied to items that don't have their own)
             document_tags: Optional list of tags applied to all items in this batch (merged with per-item tags)
             retain_async: If True, process asynchronously in background (default: False)
+            chunk_size: If set, split ``items`` into requests of about this many items and send
+                them concurrently. Items sharing a document ID always stay in the same request.
+                Chunks are not atomic: if one fails, the others may already be stored.
+            max_concurrency: Maximum number of chunk requests in flight at once (default: 4)
 
         Returns:
-            RetainResponse with success status and item count
+            RetainResponse with success status and item count. For a chunked retain the
+            counts and usage are summed, and async operation IDs are listed in ``operation_ids``.
         """
+        if chunk_size and len(items) > chunk_size:
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def send(chunk: list[dict[str, Any]]) -> RetainResponse:
+                async with semaphore:
+                    return await self.aretain_batch(
+                        bank_id=bank_id,
+                        items=chunk,
+                        document_id=document_id,
+                        document_tags=document_tags,
+                        retain_async=retain_async,
+                    )
+
+            chunks = _chunk_retain_items(items, document_id, chunk_size)
+            return _merge_retain_responses(await asyncio.gather(*(send(chunk) for chunk in chunks)))
+
         from hindsight_client_api.models.entity_input import EntityInput
         from hindsight_client_api.models.observation_scopes import ObservationScopes
         from hindsight_client_api.models.timestamp import Timestamp
@@ -762,7 +1093,9 @@ class Hindsight:
             document_tags=document_tags,
         )
 
-        return await self._memory_api.retain_memories(bank_id, request_obj, _request_timeout=self._timeout)
+        response = await self._memory_api.retain_memories(bank_id, request_obj, _request_timeout=self._timeout)
+        self._invalidate_cache(bank_id)
+        return response
 
     async def aretain(
         self,
@@ -860,21 +1193,34 @@ class Hindsight:
         Returns:
             RecallResponse with results, optional entities, optional chunks, optional source_facts, and optional trace
         """
-        from hindsight_client_api.models import (
-            chunk_include_options,
-            entity_include_options,
-            include_options,
-            source_facts_include_options,
-        )
-
-        include_opts = include_options.IncludeOptions(
-            entities=entity_include_options.EntityIncludeOptions(max_tokens=max_entity_tokens)
-            if include_entities
-            else None,
-            chunks=chunk_include_options.ChunkIncludeOptions(max_tokens=max_chunk_tokens) if include_chunks else None,
-            source_facts=source_facts_include_options.SourceFactsIncludeOptions(max_tokens=max_source_facts_tokens)
-            if include_source_facts
-            else None,
+        cache_scope = None
+        if self._cache is not None:
+            cache_scope = self._cache_scope(
+                "recall",
+                bank_id=bank_id,
+                types=types,
+                max_tokens=max_tokens,
+                budget=budget,
+                trace=trace,
+                query_timestamp=query_timestamp,
+                include_entities=include_entities,
+                max_entity_tokens=max_entity_tokens,
+                include_chunks=include_chunks,
+                max_chunk_tokens=max_chunk_tokens,
+                include_source_facts=include_source_facts,
+                max_source_facts_tokens=max_source_facts_tokens,
+                tags=tags,
+                tags_match=tags_match,
+                tag_groups=tag_groups,
+            )
+            cached = self._cache.get(query, cache_scope)
+            if cached is not None:
+                return cached
+
+        include_opts = _recall_include_options(
+            max_entity_tokens if include_entities else None,
+            max_chunk_tokens if include_chunks else None,
+            max_source_facts_tokens if include_source_facts else None,
         )
 
         tag_groups_objs = None
@@ -896,7 +1242,10 @@ class Hindsight:
             tag_groups=tag_groups_objs,
         )
 
-        return await self._memory_api.recall_memories(bank_id, request_obj, _request_timeout=self._timeout)
+        response = await self._memory_api.recall_memories(bank_id, request_obj, _request_timeout=self._timeout)
+        if cache_scope is not None:
+            self._cache.put(query, cache_scope, response, group=bank_id)
+        return response
 
     async def areflect(
         self,
@@ -940,6 +1289,27 @@ class Hindsight:
             ReflectResponse with answer text, optionally facts used, and optionally
             structured_output if response_schema was provided
         """
+        cache_scope = None
+        if self._cache is not None:
+            cache_scope = self._cache_scope(
+                "reflect",
+                bank_id=bank_id,
+                budget=budget,
+                context=context,
+                max_tokens=max_tokens,
+                response_schema=response_schema,
+                tags=tags,
+                tags_match=tags_match,
+                include_facts=include_facts,
+                tag_groups=tag_groups,
+                fact_types=fact_types,
+                exclude_mental_models=exclude_mental_models,
+                exclude_mental_model_ids=exclude_mental_model_ids,
+            )
+            cached = self._cache.get(query, cache_scope)
+            if cached is not None:
+                return cached
+
         include = ReflectIncludeOptions(facts={}) if include_facts else None
 
         tag_groups_objs = None
@@ -963,7 +1333,10 @@ class Hindsight:
             exclude_mental_model_ids=exclude_mental_model_ids,
         )
 
-        return await self._memory_api.reflect(bank_id, request_obj, _request_timeout=self._timeout)
+        response = await self._memory_api.reflect(bank_id, request_obj, _request_timeout=self._timeout)
+        if cache_scope is not None:
+            self._cache.put(query, cache_scope, response, group=bank_id)
+        return response
 
     # Mental Models methods
 
@@ -0,0 +1,207 @@
+"""
+Client-side semantic cache for recall and reflect responses.
+
+This file is MAINTAINED and NOT auto-generated.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without the optional extra
+    np = None
+
+
+@dataclass
+class _Entry:
+    scope: Hashable
+    exact_key: bytes
+    row: int
+    value: Any
+    expires_at: float
+    group: Hashable | None = None
+
+
+def _exact_key(query: str) -> bytes:
+    return hashlib.blake2b(query.strip().lower().encode(), digest_size=16).digest()
+
+
+class SemanticCache:
+    """
+    In-process cache that serves a previous response when a new query is close enough in meaning.
+
+    Lookups first try an exact match on the normalized query text, which skips the
+    embedding call for literal repeats. Otherwise the query is embedded with
+    ``embed_fn`` and compared by cosine similarity against cached queries that share
+    the same scope (bank and every other request argument), so a re-phrased question
+    can skip the network round-trip entirely. Entries can be tagged with a group
+    and dropped together with :meth:`invalidate`; the client groups by bank and
+    invalidates a bank whenever it retains into it.
+
+    Cached embeddings are kept unit-normalized in one contiguous float32 matrix, so
+    the similarity scan is a single matrix-vector product. Requires ``numpy``
+    (``pip install hindsight-client[cache]``).
+
+    Example::
+
+        from hindsight_client import Hindsight, SemanticCache
+
+        cache = SemanticCache(embed_fn=my_model.encode, threshold=0.9)
+        client = Hindsight(base_url="http://localhost:8888", cache=cache)
+
+    Args:
+        embed_fn: Callable mapping a query string to an embedding vector. Called
+            synchronously on every lookup, so it should be a small local model.
+        threshold: Minimum cosine similarity for a cached query to count as a hit.
+        ttl: Seconds an entry stays valid (default: 7 days).
+        max_entries: Maximum number of cached responses; least recently used are evicted.
+    """
+
+    def __init__(
+        self,
+        embed_fn: Callable[[str], Sequence[float]],
+        threshold: float = 0.85,
+        ttl: float = 7 * 24 * 3600,
+        max_entries: int = 1024,
+    ):
+        if np is None:
+            raise ImportError("SemanticCache requires numpy: pip install 'hindsight-client[cache]'")
+        self._embed_fn = embed_fn
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[int, _Entry] = OrderedDict()
+        self._exact: dict[tuple[Hashable, bytes], int] = {}
+        self._groups: dict[Hashable, set[int]] = {}
+        # Row i of _matrix holds the embedding of entry _row_ids[i]; rows stay packed at the front
+        self._matrix: np.ndarray | None = None
+        self._row_ids: list[int] = []
+        self._next_id = 0
+        self._lock = threading.Lock()
+        self.exact_hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+
+    @property
+    def hits(self) -> int:
+        """Lookups served from either tier."""
+        return self.exact_hits + self.semantic_hits
+
+    def stats(self) -> tuple[int, int, int]:
+        """Return ``(exact_hits, semantic_hits, misses)``."""
+        return self.exact_hits, self.semantic_hits, self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _embed(self, query: str) -> "np.ndarray":
+        vector = np.asarray(self._embed_fn(query), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def get(self, query: str, scope: Hashable) -> Any | None:
+        """Return the cached response for the most similar query in ``scope``, or None on a miss."""
+        now = time.monotonic()
+        with self._lock:
+            entry_id = self._exact.get((scope, _exact_key(query)))
+            if entry_id is not None:
+                if self._entries[entry_id].expires_at > now:
+                    self._entries.move_to_end(entry_id)
+                    self.exact_hits += 1
+                    return self._entries[entry_id].value
+                self._remove(entry_id)
+
+        embedding = self._embed(query)
+        with self._lock:
+            if self._row_ids:
+                scores = self._matrix[: len(self._row_ids)] @ embedding
+                # Walk the rows above the threshold from most to least similar
+                candidates = np.flatnonzero(scores >= self.threshold)
+                expired = []
+                for row in candidates[np.argsort(-scores[candidates])]:
+                    entry_id = self._row_ids[row]
+                    entry = self._entries[entry_id]
+                    if entry.expires_at <= now:
+                        expired.append(entry_id)
+                    elif entry.scope == scope:
+                        self._entries.move_to_end(entry_id)
+                        self.semantic_hits += 1
+                        for stale_id in expired:
+                            self._remove(stale_id)
+                        return entry.value
+                for stale_id in expired:
+                    self._remove(stale_id)
+            self.misses += 1
+            return None
+
+    def put(self, query: str, scope: Hashable, value: Any, group: Hashable | None = None) -> None:
+        """
+        Cache ``value`` as the response to ``query`` within ``scope``.
+
+        ``group`` tags the entry for :meth:`invalidate`; the client uses the bank ID.
+        """
+        exact_key = _exact_key(query)
+        embedding = self._embed(query)
+        with self._lock:
+            previous_id = self._exact.get((scope, exact_key))
+            if previous_id is not None:
+                self._remove(previous_id)
+            if self._matrix is None:
+                self._matrix = np.empty((self.max_entries + 1, embedding.shape[0]), dtype=np.float32)
+            row = len(self._row_ids)
+            self._matrix[row] = embedding
+            entry_id = self._next_id
+            self._next_id += 1
+            self._row_ids.append(entry_id)
+            self._entries[entry_id] = _Entry(scope, exact_key, row, value, time.monotonic() + self.ttl, group)
+            self._exact[(scope, exact_key)] = entry_id
+            if group is not None:
+                self._groups.setdefault(group, set()).add(entry_id)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, group: Hashable) -> None:
+        """Drop every entry cached with ``group``, e.g. after the bank it belongs to was written to."""
+        with self._lock:
+            for entry_id in list(self._groups.get(group, ())):
+                self._remove(entry_id)
+
+    def _remove(self, entry_id: int) -> None:
+        entry = self._entries.pop(entry_id)
+        del self._exact[(entry.scope, entry.exact_key)]
+        if entry.group is not None:
+            members = self._groups[entry.group]
+            members.discard(entry_id)
+            if not members:
+                del self._groups[entry.group]
+        # Swap the last row into the freed slot to keep the matrix packed
+        last = len(self._row_ids) - 1
+        if entry.row != last:
+            moved_id = self._row_ids[last]
+            self._matrix[entry.row] = self._matrix[last]
+            self._row_ids[entry.row] = moved_id
+            self._entries[moved_id].row = entry.row
+        self._row_ids.pop()
+
+    def clear(self) -> None:
+        """Drop every cached response and reset the hit counters."""
+        with self._lock:
+            self._entries.clear()
+            self._exact.clear()
+            self._groups.clear()
+            self._row_ids.clear()
+            self.exact_hits = 0
+            self.semantic_hits = 0
+            self.misses = 0
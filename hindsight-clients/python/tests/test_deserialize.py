@@ -0,0 +1,47 @@
+"""
+Test response deserialization through the client's ApiClient.
+"""
+
+from unittest.mock import patch
+
+import orjson
+import pytest
+
+from hindsight_client import Hindsight, RetainResponse
+from hindsight_client.hindsight_client import _GENERATED_DESERIALIZE
+from hindsight_client_api.exceptions import ApiException
+
+
+@pytest.fixture
+def api_client():
+    client = Hindsight(base_url="http://localhost:8888")
+    yield client._api_client
+    client.close()
+
+
+def test_json_response_deserializes_to_model(api_client):
+    body = '{"success": true, "bank_id": "bank", "items_count": 2, "async": false, "operation_ids": ["op-1"]}'
+
+    response = api_client.deserialize(body, "RetainResponse", "application/json; charset=utf-8")
+
+    assert isinstance(response, RetainResponse)
+    assert response.items_count == 2
+    assert response.operation_ids == ["op-1"]
+
+
+def test_json_response_parsed_with_orjson(api_client):
+    # A regeneration that renames the private hook would silently disable the orjson path
+    assert _GENERATED_DESERIALIZE is not None
+
+    with patch.object(orjson, "loads", wraps=orjson.loads) as loads:
+        api_client.deserialize('{"status": "ok"}', "object", "application/problem+json")
+        api_client.deserialize('{"status": "ok"}', "object", "text/json")
+
+    loads.assert_called_once_with('{"status": "ok"}')
+
+
+def test_non_json_bodies_keep_generated_behavior(api_client):
+    assert api_client.deserialize("plain", "str", None) == "plain"
+    assert api_client.deserialize("[1]", "str", "text/plain") == "[1]"
+    with pytest.raises(ApiException):
+        api_client.deserialize("{}", "object", "application/xml")
@@ -0,0 +1,59 @@
+"""
+Test that aretain_batch(chunk_size=...) splits large batches without splitting documents.
+"""
+
+from unittest.mock import AsyncMock
+
+from hindsight_client import Hindsight, RetainResponse
+
+
+def _make_client():
+    client = Hindsight(base_url="http://localhost:8888")
+
+    async def retain_memories(bank_id, request, **kwargs):
+        ids = [f"op-{item.content}" for item in request.items]
+        return RetainResponse(
+            success=True, bank_id=bank_id, items_count=len(request.items), var_async=request.var_async, operation_ids=ids
+        )
+
+    client._memory_api.retain_memories = AsyncMock(side_effect=retain_memories)
+    return client
+
+
+def _sent_contents(client):
+    return [[item.content for item in call.args[1].items] for call in client._memory_api.retain_memories.call_args_list]
+
+
+async def test_unchunked_by_default():
+    client = _make_client()
+
+    response = await client.aretain_batch("bank", [{"content": str(i)} for i in range(5)])
+
+    assert client._memory_api.retain_memories.await_count == 1
+    assert response.items_count == 5
+
+
+async def test_chunks_merge_counts_and_operation_ids():
+    client = _make_client()
+
+    response = await client.aretain_batch("bank", [{"content": str(i)} for i in range(5)], chunk_size=2)
+
+    assert _sent_contents(client) == [["0", "1"], ["2", "3"], ["4"]]
+    assert response.items_count == 5
+    assert response.operation_ids == ["op-0", "op-1", "op-2", "op-3", "op-4"]
+    assert response.operation_id is None
+
+
+async def test_document_items_stay_in_one_chunk():
+    client = _make_client()
+    items = [
+        {"content": "a"},
+        {"content": "doc-1", "document_id": "doc"},
+        {"content": "doc-2", "document_id": "doc"},
+        {"content": "b"},
+        {"content": "doc-3", "document_id": "doc"},
+    ]
+
+    await client.aretain_batch("bank", items, chunk_size=2)
+
+    assert _sent_contents(client) == [["a"], ["doc-1", "doc-2", "doc-3"], ["b"]]
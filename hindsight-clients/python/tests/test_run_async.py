@@ -0,0 +1,25 @@
+"""
+Test the shared background event loop behind the sync wrappers.
+"""
+
+import asyncio
+
+from hindsight_client.hindsight_client import _run_async
+
+
+async def _current_loop():
+    return asyncio.get_running_loop()
+
+
+def test_run_async_reuses_one_background_loop():
+    """Sync calls should all run on the same long-lived loop so the HTTP session survives between them."""
+    first = _run_async(_current_loop())
+    second = _run_async(_current_loop())
+
+    assert first is second
+    assert first.is_running()
+
+
+async def test_run_async_from_running_loop():
+    """Sync wrappers should not fail with 'loop already running' when called from async code."""
+    assert _run_async(_current_loop()) is not asyncio.get_running_loop()
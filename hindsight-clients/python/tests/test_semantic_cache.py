@@ -0,0 +1,114 @@
+"""
+Test the client-side semantic cache and its use by recall/reflect.
+"""
+
+from unittest.mock import AsyncMock, Mock
+
+from hindsight_client import Hindsight, SemanticCache
+
+_VOCAB = ["alice", "like", "likes", "what", "does", "bob", "work", "where"]
+
+
+def _embed(text: str) -> list[float]:
+    """Toy bag-of-words embedding over a fixed vocabulary."""
+    words = text.lower().replace("?", "").split()
+    return [float(words.count(w)) for w in _VOCAB]
+
+
+def test_similar_query_hits_within_scope():
+    cache = SemanticCache(embed_fn=_embed, threshold=0.8)
+    cache.put("What does Alice like?", "bank-a", "cached")
+
+    assert cache.get("what does alice like", "bank-a") == "cached"
+    assert cache.get("What does Alice like?", "bank-b") is None
+    assert cache.get("Where does Bob work?", "bank-a") is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_literal_repeat_skips_embedding():
+    embed = Mock(side_effect=_embed)
+    cache = SemanticCache(embed_fn=embed)
+    cache.put("What does Alice like?", "bank", "cached")
+    embed.reset_mock()
+
+    assert cache.get("  what does alice LIKE?  ", "bank") == "cached"
+    embed.assert_not_called()
+
+    assert cache.get("what does alice like", "bank") == "cached"
+    assert cache.stats() == (1, 1, 0)
+
+
+def test_expired_and_evicted_entries_miss():
+    cache = SemanticCache(embed_fn=_embed, ttl=0)
+    cache.put("What does Alice like?", "bank", "cached")
+    assert cache.get("What does Alice like?", "bank") is None
+
+    cache = SemanticCache(embed_fn=_embed, max_entries=1)
+    cache.put("What does Alice like?", "bank", "alice")
+    cache.put("Where does Bob work?", "bank", "bob")
+    assert len(cache) == 1
+    assert cache.get("What does Alice like?", "bank") is None
+    assert cache.get("Where does Bob work?", "bank") == "bob"
+
+
+def test_swap_remove_keeps_rows_consistent():
+    cache = SemanticCache(embed_fn=_embed, max_entries=2)
+    cache.put("What does Alice like?", "bank", "alice")
+    cache.put("Where does Bob work?", "bank", "bob")
+    # Re-putting the first query frees row 0 and moves Bob's row into it
+    cache.put("What does Alice like?", "bank", "alice-2")
+    cache.put("Does Bob like work?", "bank", "mixed")
+
+    assert len(cache) == 2
+    assert cache.get("Where does Bob work", "bank") is None
+    assert cache.get("what does alice like", "bank") == "alice-2"
+
+
+async def test_arecall_served_from_cache():
+    client = Hindsight(base_url="http://localhost:8888", cache=SemanticCache(embed_fn=_embed))
+    client._memory_api.recall_memories = AsyncMock(return_value="response")
+
+    assert await client.arecall("bank", "What does Alice like?") == "response"
+    assert await client.arecall("bank", "what does alice like") == "response"
+    client._memory_api.recall_memories.assert_awaited_once()
+
+    # Different request arguments are a different scope
+    await client.arecall("bank", "What does Alice like?", budget="high")
+    assert client._memory_api.recall_memories.await_count == 2
+
+
+def test_invalidate_drops_group_entries():
+    cache = SemanticCache(embed_fn=_embed)
+    cache.put("What does Alice like?", "scope-a", "alice", group="bank-a")
+    cache.put("Where does Bob work?", "scope-b", "bob", group="bank-b")
+
+    cache.invalidate("bank-a")
+
+    assert len(cache) == 1
+    assert cache.get("What does Alice like?", "scope-a") is None
+    assert cache.get("Where does Bob work?", "scope-b") == "bob"
+
+
+async def test_retain_invalidates_cached_recall():
+    client = Hindsight(base_url="http://localhost:8888", cache=SemanticCache(embed_fn=_embed))
+    client._memory_api.recall_memories = AsyncMock(return_value="response")
+    client._memory_api.retain_memories = AsyncMock(return_value="retained")
+
+    await client.arecall("bank", "What does Alice like?")
+    await client.arecall("other", "What does Alice like?")
+    await client.aretain("bank", "Alice likes tea")
+    await client.arecall("bank", "What does Alice like?")
+    await client.arecall("other", "What does Alice like?")
+
+    # The retained bank misses and is fetched again; the other bank is still cached
+    assert client._memory_api.recall_memories.await_count == 3
+    assert client._cache.stats() == (1, 0, 3)
+
+
+async def test_areflect_served_from_cache():
+    client = Hindsight(base_url="http://localhost:8888", cache=SemanticCache(embed_fn=_embed))
+    client._memory_api.reflect = AsyncMock(return_value="answer")
+
+    await client.areflect("bank", "What does Alice like?")
+    await client.areflect("bank", "What does Alice like?")
+    client._memory_api.reflect.assert_awaited_once()
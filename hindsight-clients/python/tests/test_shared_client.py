@@ -0,0 +1,164 @@
+"""
+Test shared ApiClients and how Hindsight.close()/aclose() release the underlying HTTP session.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from hindsight_client import Hindsight
+from hindsight_client.hindsight_client import _run_async
+from hindsight_client_api.api.monitoring_api import MonitoringApi
+
+
+async def _open_session(client: Hindsight) -> None:
+    client._api_client._ensure_session()
+
+
+def test_shared_instances_reuse_api_client():
+    first = Hindsight(base_url="http://localhost:8888", shared=True)
+    second = Hindsight(base_url="http://localhost:8888", shared=True)
+    separate = Hindsight(base_url="http://localhost:8888")
+    other_key = Hindsight(base_url="http://localhost:8888", api_key="key", shared=True)
+
+    assert first._api_client is second._api_client
+    assert separate._api_client is not first._api_client
+    assert other_key._api_client is not first._api_client
+
+    for client in (first, second, separate, other_key):
+        client.close()
+
+
+def test_shared_api_client_closed_by_last_instance():
+    first = Hindsight(base_url="http://localhost:8888", shared=True)
+    second = Hindsight(base_url="http://localhost:8888", shared=True)
+    api_client = first._api_client
+    _run_async(_open_session(first))
+    api_client.close = AsyncMock(side_effect=api_client.close)
+
+    first.close()
+    api_client.close.assert_not_awaited()
+
+    second.close()
+    api_client.close.assert_awaited_once()
+
+    third = Hindsight(base_url="http://localhost:8888", shared=True)
+    assert third._api_client is not api_client
+    third.close()
+
+
+def test_close_is_idempotent():
+    client = Hindsight(base_url="http://localhost:8888")
+    _run_async(_open_session(client))
+    session = client._api_client.rest_client._pool_manager
+
+    client.close()
+    client.close()
+
+    assert session.closed
+
+
+async def test_close_from_running_loop_closes_background_session():
+    client = Hindsight(base_url="http://localhost:8888")
+    _run_async(_open_session(client))
+    session = client._api_client.rest_client._pool_manager
+
+    await client.aclose()
+
+    assert session.closed
+
+
+def test_close_without_requests_is_noop():
+    client = Hindsight(base_url="http://localhost:8888")
+    client._api_client.close = AsyncMock()
+
+    client.close()
+
+    client._api_client.close.assert_not_awaited()
+
+
+def test_warmup_requests_health_in_background(caplog):
+    with patch.object(MonitoringApi, "health_endpoint_health_get", AsyncMock(side_effect=OSError("refused"))) as health:
+        client = Hindsight(base_url="http://localhost:8888", warmup=True)
+        client._warmup_future.result(timeout=5)
+
+    health.assert_awaited_once()
+    assert "warmup to http://localhost:8888 failed: OSError('refused')" in caplog.text
+    assert Hindsight(base_url="http://localhost:8888")._warmup_future is None
+    client.close()
+
+
+def test_close_cancels_pending_warmup():
+    opened = []
+
+    async def slow_health(self, **kwargs):
+        await asyncio.sleep(0.2)
+        self.api_client._ensure_session()
+        opened.append(True)
+
+    with patch.object(MonitoringApi, "health_endpoint_health_get", slow_health):
+        client = Hindsight(base_url="http://localhost:8888", warmup=True)
+        future = client._warmup_future
+        client.close()
+
+    assert future.cancelled()
+    assert client._warmup_future is None
+    _run_async(asyncio.sleep(0.3))
+    assert not opened
+    assert client._api_client.session_loop is None
+    assert client._api_client.rest_client._pool_manager is None
+
+
+def test_shared_close_cancels_only_own_warmup():
+    async def pending_health(self, **kwargs):
+        await asyncio.sleep(0.2)
+
+    with patch.object(MonitoringApi, "health_endpoint_health_get", pending_health):
+        first = Hindsight(base_url="http://localhost:8888", shared=True, warmup=True)
+        second = Hindsight(base_url="http://localhost:8888", shared=True, warmup=True)
+        first_warmup, second_warmup = first._warmup_future, second._warmup_future
+        first.close()
+
+        assert first_warmup.cancelled()
+        assert not second_warmup.done()
+        second.close()
+
+    assert second_warmup.cancelled()
+
+
+def test_close_after_user_loop_finished():
+    client = Hindsight(base_url="http://localhost:8888")
+    asyncio.run(_open_session(client))
+    session = client._api_client.rest_client._pool_manager
+
+    client.close()
+
+    assert session.closed
+
+
+def test_close_after_user_loop_stopped():
+    client = Hindsight(base_url="http://localhost:8888")
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(_open_session(client))
+        session = client._api_client.rest_client._pool_manager
+        assert client._api_client.session_loop is loop
+
+        client.close()
+
+        assert session.closed
+    finally:
+        loop.close()
+
+
+async def test_aclose_after_user_loop_stopped():
+    client = Hindsight(base_url="http://localhost:8888")
+    loop = asyncio.new_event_loop()
+    try:
+        await asyncio.to_thread(loop.run_until_complete, _open_session(client))
+        session = client._api_client.rest_client._pool_manager
+
+        await client.aclose()
+
+        assert session.closed
+    finally:
+        loop.close()
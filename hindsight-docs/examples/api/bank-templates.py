@@ -15,6 +15,9 @@ HINDSIGHT_URL = os.getenv("HINDSIGHT_API_URL", "http://localhost:8888")
 # =============================================================================
 
 # [docs:import-template]
+# A Session reuses the HTTP connection across the requests below
+session = requests.Session()
+
 template = {
     "version": "1",
     "bank": {
@@ -39,7 +42,7 @@ template = {
     ],
 }
 
-response = requests.post(
+response = session.post(
     f"{HINDSIGHT_URL}/v1/default/banks/my-bank/import",
     json=template,
 )
@@ -51,7 +54,7 @@ print(f"Directives created: {result['directives_created']}")
 
 
 # [docs:import-dry-run]
-response = requests.post(
+response = session.post(
     f"{HINDSIGHT_URL}/v1/default/banks/my-bank/import",
     params={"dry_run": "true"},
     json=template,
@@ -63,7 +66,7 @@ print(f"Would apply config: {result['config_applied']}")
 
 
 # [docs:export-template]
-response = requests.get(
+response = session.get(
     f"{HINDSIGHT_URL}/v1/default/banks/my-bank/export"
 )
 exported = response.json()
@@ -73,13 +76,13 @@ print(json.dumps(exported, indent=2))
 
 # [docs:export-reimport]
 # Export from source bank
-response = requests.get(
+response = session.get(
     f"{HINDSIGHT_URL}/v1/default/banks/source-bank/export"
 )
 exported = response.json()
 
 # Import into a new bank
-response = requests.post(
+response = session.post(
     f"{HINDSIGHT_URL}/v1/default/banks/new-bank/import",
     json=exported,
 )
@@ -87,9 +90,15 @@ response = requests.post(
 
 
 # [docs:get-schema]
-response = requests.get(
+response = session.get(
     f"{HINDSIGHT_URL}/v1/bank-template-schema"
 )
 schema = response.json()
 print(json.dumps(schema, indent=2))
 # [/docs:get-schema]
+
+
+# =============================================================================
+# Cleanup (not shown in docs)
+# =============================================================================
+session.close()
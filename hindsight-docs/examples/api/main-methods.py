@@ -172,6 +172,16 @@ async def async_example():
     response = await async_client.areflect(bank_id="my-bank", query="What was stored?")
     print(response.text)
 
+    # Independent calls can run concurrently over the client's connection pool
+    queries = ["Async", "memory", "stored"]
+    responses = await asyncio.gather(
+        *(async_client.arecall(bank_id="my-bank", query=q) for q in queries)
+    )
+    for q, res in zip(queries, responses):
+        print(f"{q}: {len(res)} results")
+
+    await async_client.aclose()
+
 asyncio.run(async_example())
 # [/docs:main-async]
 
@@ -18,9 +18,14 @@ client = Hindsight(base_url=HINDSIGHT_URL)
 
 # Create bank and seed some data
 client.create_bank(bank_id=BANK_ID, name="Mental Models Demo")
-client.retain(bank_id=BANK_ID, content="The team prefers async communication via Slack")
-client.retain(bank_id=BANK_ID, content="For urgent issues, use the #incidents channel")
-client.retain(bank_id=BANK_ID, content="Weekly syncs happen every Monday at 10am")
+client.retain_batch(
+    bank_id=BANK_ID,
+    items=[
+        {"content": "The team prefers async communication via Slack"},
+        {"content": "For urgent issues, use the #incidents channel"},
+        {"content": "Weekly syncs happen every Monday at 10am"},
+    ],
+)
 
 # Wait for data to be processed
 time.sleep(2)
@@ -16,9 +16,14 @@ from hindsight_client import Hindsight
 client = Hindsight(base_url=HINDSIGHT_URL)
 
 # Seed some data for recall examples
-client.retain(bank_id="my-bank", content="Alice works at Google as a software engineer")
-client.retain(bank_id="my-bank", content="Alice loves hiking on weekends")
-client.retain(bank_id="my-bank", content="Bob is a data scientist who works with Alice")
+client.retain_batch(
+    bank_id="my-bank",
+    items=[
+        {"content": "Alice works at Google as a software engineer"},
+        {"content": "Alice loves hiking on weekends"},
+        {"content": "Bob is a data scientist who works with Alice"},
+    ],
+)
 
 # =============================================================================
 # Doc Examples
@@ -16,9 +16,14 @@ from hindsight_client import Hindsight
 client = Hindsight(base_url=HINDSIGHT_URL)
 
 # Seed some data for reflect examples
-client.retain(bank_id="my-bank", content="Alice works at Google as a software engineer")
-client.retain(bank_id="my-bank", content="Alice has been working there for 5 years")
-client.retain(bank_id="my-bank", content="Alice recently got promoted to senior engineer")
+client.retain_batch(
+    bank_id="my-bank",
+    items=[
+        {"content": "Alice works at Google as a software engineer"},
+        {"content": "Alice has been working there for 5 years"},
+        {"content": "Alice recently got promoted to senior engineer"},
+    ],
+)
 
 # =============================================================================
 # Doc Examples